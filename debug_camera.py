@@ -4,29 +4,58 @@ Camera enumeration diagnostics.
 Tests MVSDK camera detection with detailed error reporting.
 """
 
+import importlib
 import logging
+import os
 import sys
+import time
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+MVSDK_MODULE = "src.lib.mvsdk"
+
+# Process-wide (timestamp, device list) cache for CameraEnumerateDevice()
+DEVICE_CACHE_TTL_SEC = 2.0
+_DEV_CACHE: tuple[float, list] = (0.0, [])
+
+
+def get_mvsdk():
+    """Return the MVSDK module, reusing the copy already in sys.modules."""
+    module = sys.modules.get(MVSDK_MODULE)
+    if module is not None:
+        return module
+    return importlib.import_module(MVSDK_MODULE)
+
+
+def enumerate_cached(mvsdk, ttl: float = DEVICE_CACHE_TTL_SEC) -> list:
+    """Return the enumerated device list, re-running SDK discovery at most once per ttl."""
+    global _DEV_CACHE
+    now = time.monotonic()
+    cached_at, devices = _DEV_CACHE
+    if devices and now - cached_at < ttl:
+        return devices
+    devices = mvsdk.CameraEnumerateDevice()
+    _DEV_CACHE = (now, devices)
+    return devices
+
 
 def test_mvsdk_import():
     """Test if MVSDK module can be imported."""
     try:
-        from src.lib import mvsdk
+        mvsdk = get_mvsdk()
 
         logger.info("✅ MVSDK module imported successfully")
-        logger.info(f"   MVSDK location: {mvsdk.__file__}")
+        logger.info("   MVSDK location: %s", mvsdk.__file__)
         return mvsdk
     except ImportError as e:
-        logger.error(f"❌ Failed to import MVSDK: {e}")
+        logger.error("❌ Failed to import MVSDK: %s", e)
         logger.error("   Ensure spec/python_demo/mvsdk.py is accessible")
         return None
     except Exception as e:
-        logger.error(f"❌ Unexpected error importing MVSDK: {e}")
+        logger.error("❌ Unexpected error importing MVSDK: %s", e)
         return None
 
 
@@ -34,28 +63,34 @@ def test_camera_enumeration(mvsdk):
     """Test camera enumeration."""
     try:
         logger.info("🔍 Calling mvsdk.CameraEnumerateDevice()...")
-        dev_list = mvsdk.CameraEnumerateDevice()
+        dev_list = enumerate_cached(mvsdk)
 
-        logger.info(f"📊 Found {len(dev_list)} camera(s)")
+        logger.info("📊 Found %d camera(s)", len(dev_list))
 
-        for i, dev_info in enumerate(dev_list):
-            logger.info(f"\n--- Camera {i} ---")
+        # Only decode per-device fields when INFO records will actually be emitted.
+        # MVSDK has no bulk device-list getter; the fields are already in the
+        # enumerated structs, so read them all in one pass before logging.
+        if logger.isEnabledFor(logging.INFO):
             try:
-                logger.info(f"  Friendly Name: {dev_info.GetFriendlyName()}")
-                logger.info(f"  Port Type: {dev_info.GetPortType()}")
+                infos = [(d.GetFriendlyName(), d.GetPortType()) for d in dev_list]
             except Exception as e:
-                logger.error(f"  Error getting camera info: {e}")
+                logger.error("  Error getting camera info: %s", e)
+                infos = []
+            for i, (name, port) in enumerate(infos):
+                logger.info("\n--- Camera %d ---", i)
+                logger.info("  Friendly Name: %s", name)
+                logger.info("  Port Type: %s", port)
 
         return dev_list
 
     except Exception as e:
-        logger.error(f"❌ Camera enumeration failed: {e}")
+        logger.error("❌ Camera enumeration failed: %s", e)
         if hasattr(mvsdk, "CameraGetErrorString"):
             try:
                 error_code = getattr(e, "error_code", None)
                 if error_code is not None:
                     error_str = mvsdk.CameraGetErrorString(error_code)
-                    logger.error(f"   Error code {error_code}: {error_str}")
+                    logger.error("   Error code %s: %s", error_code, error_str)
             except Exception:
                 pass
         return []
@@ -64,28 +99,26 @@ def test_camera_enumeration(mvsdk):
 def test_camera_init():
     """Test full camera initialization."""
     try:
-        import os
-
         from src.camera.init import initialize_camera
 
         # Use environment variable if set
         camera_ip = os.environ.get("CAMERA_IP", "169.254.170.200")
-        logger.info(f"🎬 Testing camera initialization with IP: {camera_ip}")
+        logger.info("🎬 Testing camera initialization with IP: %s", camera_ip)
 
         camera, error = initialize_camera(camera_ip)
 
         if error:
-            logger.error(f"❌ Camera initialization failed: {error}")
+            logger.error("❌ Camera initialization failed: %s", error)
             return False
 
         if camera:
             logger.info("✅ Camera initialized successfully!")
             try:
                 cap = camera.get_capability()
-                logger.info(f"   Resolution: {cap.max_width}x{cap.max_height}")
-                logger.info(f"   Camera info: {camera.info()}")
+                logger.info("   Resolution: %dx%d", cap.max_width, cap.max_height)
+                logger.info("   Camera info: %s", camera.info())
             except Exception as e:
-                logger.error(f"   Error getting camera capabilities: {e}")
+                logger.error("   Error getting camera capabilities: %s", e)
 
             # Cleanup
             camera.__exit__(None, None, None)
@@ -95,10 +128,7 @@ def test_camera_init():
         return False
 
     except Exception as e:
-        logger.error(f"❌ Unexpected error during camera init test: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("❌ Unexpected error during camera init test: %s", e)
         return False
 
 
@@ -137,9 +167,9 @@ def main():
     logger.info("\n" + "=" * 60)
     logger.info("Diagnostic Summary")
     logger.info("=" * 60)
-    logger.info(f"MVSDK Import:        {'✅ PASS' if mvsdk else '❌ FAIL'}")
-    logger.info(f"Camera Enumeration:  {'✅ PASS' if devices else '⚠️  No cameras'}")
-    logger.info(f"Camera Initialization: {'✅ PASS' if success else '❌ FAIL'}")
+    logger.info("MVSDK Import:        %s", "✅ PASS" if mvsdk else "❌ FAIL")
+    logger.info("Camera Enumeration:  %s", "✅ PASS" if devices else "⚠️  No cameras")
+    logger.info("Camera Initialization: %s", "✅ PASS" if success else "❌ FAIL")
     logger.info("=" * 60)
 
     if not success:
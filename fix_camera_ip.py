@@ -5,9 +5,19 @@ This changes the camera's IP instead of your computer's IP.
 """
 
 import sys
+import traceback
 
 from src.lib import mvsdk
 
+# CameraGigeSetIp status codes -> human-readable message
+_ERR_MSGS = {
+    -1: "CAMERA_STATUS_FAILED - General failure",
+    -4: "CAMERA_STATUS_NOT_SUPPORTED - Function not supported",
+    -6: "CAMERA_STATUS_PARAMETER_INVALID - Invalid parameters",
+    -12: "CAMERA_STATUS_TIME_OUT - Timeout",
+    -14: "CAMERA_STATUS_COMM_ERROR - Communication error",
+}
+
 
 def main():
     try:
@@ -66,13 +76,7 @@ def main():
             print(f"  2. Run: python main.py --camera-ip {new_ip} --check")
             return 0
         else:
-            error_msg = {
-                -1: "CAMERA_STATUS_FAILED - General failure",
-                -4: "CAMERA_STATUS_NOT_SUPPORTED - Function not supported",
-                -6: "CAMERA_STATUS_PARAMETER_INVALID - Invalid parameters",
-                -12: "CAMERA_STATUS_TIME_OUT - Timeout",
-                -14: "CAMERA_STATUS_COMM_ERROR - Communication error",
-            }.get(result, f"Unknown error code: {result}")
+            error_msg = _ERR_MSGS.get(result, f"Unknown error code: {result}")
 
             print("\n❌ Failed to change camera IP")
             print(f"   Error: {error_msg}")
@@ -85,8 +89,6 @@ def main():
 
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-
         traceback.print_exc()
         return 1
 
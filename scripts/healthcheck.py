@@ -4,7 +4,11 @@ Health check script for camera connectivity validation.
 Runs before app startup to warn about network issues.
 
 Usage:
-    python scripts/healthcheck.py
+    python scripts/healthcheck.py [--json]
+
+Output:
+    Human-readable report by default; a single JSON line with --json (or
+    HEALTHCHECK_JSON=1), e.g. for a Docker healthcheck parsed by tooling.
 
 Exit codes:
     0 - All checks passed
@@ -12,113 +16,174 @@ Exit codes:
     2 - Warning (camera unreachable but not blocking)
 """
 
+import argparse
+import ipaddress
+import json
 import os
 import socket
-import subprocess
 import sys
 from typing import Optional
 
+# GigE Vision control protocol (GVCP) port and DISCOVERY_CMD packet:
+# key 0x42, flags 0x11 (ack required), command 0x0002, length 0, req_id 0xFFFF
+GVCP_PORT = 3956
+GVCP_DISCOVERY_CMD = b"\x42\x11\x00\x02\x00\x00\xff\xff"
+GVCP_TIMEOUT_SEC = 0.3
+
+# Report state, written to stdout once by flush_report()
+_lines: list[str] = []
+_result: dict = {
+    "profile": None,
+    "camera_ip": None,
+    "ip_valid": None,
+    "reachable": None,
+    "warnings": [],
+    "errors": [],
+}
+
+
+def say(message: str = "") -> None:
+    """Buffer one line of the human-readable report."""
+    _lines.append(message)
+
+
+def flush_report(exit_code: int, as_json: bool = False) -> None:
+    """Write the report in a single call: text, or one JSON line if as_json."""
+    _result["exit_code"] = exit_code
+    if as_json:
+        sys.stdout.write(json.dumps(_result) + "\n")
+    else:
+        sys.stdout.write("\n".join(_lines) + "\n")
+    sys.stdout.flush()
+
+
+def parse_camera_ip(ip: str) -> Optional[ipaddress.IPv4Address]:
+    """Parse a dotted-quad IPv4 address, or return None if it is malformed."""
+    try:
+        return ipaddress.IPv4Address(ip)
+    except ValueError:
+        return None
+
+
+def check_environment() -> tuple[bool, Optional[ipaddress.IPv4Address], Optional[str]]:
+    """Check if required environment variables are set and CAMERA_IP is valid.
 
-def check_environment() -> tuple[bool, Optional[str], Optional[str]]:
-    """Check if required environment variables are set.
+    CAMERA_IP is parsed here, once, so later checks reuse the parsed address.
 
     Returns:
         Tuple of (success, camera_ip, profile)
     """
     camera_ip = os.environ.get("CAMERA_IP")
     profile = os.environ.get("COMPOSE_PROFILES", "development")
+    _result["profile"] = profile
+    _result["camera_ip"] = camera_ip
 
     # Webcam mode doesn't need camera IP
     if profile == "webcam":
-        print("✓ Webcam mode - skipping camera checks")
+        say("✓ Webcam mode - skipping camera checks")
         return True, None, profile
 
     if not camera_ip:
-        print("✗ ERROR: CAMERA_IP not set in environment")
-        print("")
-        print("Please set CAMERA_IP in your .env file:")
-        print("  CAMERA_IP=169.254.22.149  # Replace with your camera's IP")
+        _result["errors"].append("CAMERA_IP not set")
+        say("✗ ERROR: CAMERA_IP not set in environment")
+        say("")
+        say("Please set CAMERA_IP in your .env file:")
+        say("  CAMERA_IP=169.254.22.149  # Replace with your camera's IP")
         return False, None, profile
 
-    return True, camera_ip, profile
-
+    say(f"Checking camera IP: {camera_ip}")
+    ip_obj = parse_camera_ip(camera_ip)
+    if ip_obj is None:
+        _result["ip_valid"] = False
+        _result["errors"].append(f"Invalid IP address format: {camera_ip}")
+        say(f"✗ ERROR: Invalid IP address format: {camera_ip}")
+        say("")
+        say("Expected format: XXX.XXX.XXX.XXX")
+        say("Examples: 192.168.1.100, 169.254.22.149")
+        return False, None, profile
 
-def validate_ip_address(ip: str) -> bool:
-    """Validate that the IP address format is correct."""
-    try:
-        socket.inet_aton(ip)
-        return True
-    except socket.error:
-        return False
+    _result["ip_valid"] = True
+    say("✓ IP address format is valid")
+    return True, ip_obj, profile
 
 
 def check_camera_reachable(ip: str) -> bool:
-    """Check if camera is reachable via ping."""
+    """Check if camera answers a GVCP discovery request.
+
+    Sends a single UDP packet to the GigE Vision control port instead of
+    spawning `ping`, so the check costs one round trip and does not depend
+    on ICMP being allowed or the ping binary being installed.
+    """
     try:
-        # Use ping with timeout (2 seconds)
-        result = subprocess.run(
-            ["ping", "-c", "1", "-W", "2", ip],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        # Ping not available or timeout
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(GVCP_TIMEOUT_SEC)
+            sock.sendto(GVCP_DISCOVERY_CMD, (ip, GVCP_PORT))
+            data, _ = sock.recvfrom(1024)
+            return len(data) > 0
+    except OSError:
+        # Timeout, unreachable network, or port closed
         return False
 
 
-def main() -> int:
+def run_checks() -> int:
     """Run health checks and return exit code."""
-    print("=" * 50)
-    print("Camera App Health Check")
-    print("=" * 50)
-    print("")
+    say("=" * 50)
+    say("Camera App Health Check")
+    say("=" * 50)
+    say("")
 
-    # Check environment
+    # Check environment and IP format
     success, camera_ip, profile = check_environment()
     if not success:
         return 1
 
     # Skip camera checks in webcam mode
     if profile == "webcam":
-        print("")
-        print("✓ All checks passed - ready to start in webcam mode")
+        say("")
+        say("✓ All checks passed - ready to start in webcam mode")
         return 0
 
-    # Validate IP format
-    print(f"Checking camera IP: {camera_ip}")
-    if not validate_ip_address(camera_ip):
-        print(f"✗ ERROR: Invalid IP address format: {camera_ip}")
-        print("")
-        print("Expected format: XXX.XXX.XXX.XXX")
-        print("Examples: 192.168.1.100, 169.254.22.149")
-        return 1
-
-    print("✓ IP address format is valid")
-
     # Check camera reachability
-    print(f"Checking network connectivity to {camera_ip}...")
-    if check_camera_reachable(camera_ip):
-        print(f"✓ Camera is reachable at {camera_ip}")
-        print("")
-        print("✓ All checks passed - ready to start")
+    say(f"Checking network connectivity to {camera_ip}...")
+    reachable = check_camera_reachable(str(camera_ip))
+    _result["reachable"] = reachable
+    if reachable:
+        say(f"✓ Camera is reachable at {camera_ip}")
+        say("")
+        say("✓ All checks passed - ready to start")
         return 0
     else:
-        print(f"⚠ WARNING: Cannot reach camera at {camera_ip}")
-        print("")
-        print("Possible issues:")
-        print("  1. Camera is not powered on")
-        print("  2. Camera is not connected to network")
-        print("  3. Wrong IP address in .env file")
-        print("  4. Firewall is blocking ICMP ping")
-        print("")
-        print("The app will attempt to connect anyway.")
-        print("If camera is offline, it may fall back to webcam mode.")
-        print("")
-        print("✓ Continuing with warnings")
+        _result["warnings"].append(f"Cannot reach camera at {camera_ip}")
+        say(f"⚠ WARNING: Cannot reach camera at {camera_ip}")
+        say("")
+        say("Possible issues:")
+        say("  1. Camera is not powered on")
+        say("  2. Camera is not connected to network")
+        say("  3. Wrong IP address in .env file")
+        say("  4. Firewall is blocking GigE Vision control traffic (UDP 3956)")
+        say("")
+        say("The app will attempt to connect anyway.")
+        say("If camera is offline, it may fall back to webcam mode.")
+        say("")
+        say("✓ Continuing with warnings")
         return 0  # Don't block startup, just warn
 
 
+def main() -> int:
+    """Run health checks, emit the report once, and return exit code."""
+    parser = argparse.ArgumentParser(description="Camera app health check")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=os.environ.get("HEALTHCHECK_JSON") == "1",
+        help="Emit the report as a single JSON line (default: HEALTHCHECK_JSON=1)",
+    )
+    args = parser.parse_args()
+
+    exit_code = run_checks()
+    flush_report(exit_code, as_json=args.json)
+    return exit_code
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -13,9 +13,10 @@ with proper error handling and timeout management.
 """
 
 import logging
+import os
 import threading
 import time
-from typing import Iterator, Optional, Union
+from typing import Final, Iterator, Optional, Union
 
 import numpy as np
 
@@ -25,6 +26,38 @@ from src.lib import mvsdk
 
 logger = logging.getLogger(__name__)
 
+# Per-frame debug logging switch. Defaults to __debug__ so `python -O` strips the
+# per-frame logging path entirely; otherwise it still follows the logger level.
+DEBUG_CAPTURE: Final[bool] = __debug__
+
+# CPU core reserved for the capture thread, set by main.py --high-priority
+RESERVED_CORE_ENV: Final[str] = "CAPTURE_RESERVED_CORE"
+
+
+def _pin_to_reserved_core() -> None:
+    """
+    Pin the calling thread to the CPU core reserved for capture, if any.
+
+    main.py --high-priority removes a core from the process affinity mask
+    before threads start and records it in CAPTURE_RESERVED_CORE; the capture
+    thread then claims that core for itself. Without a reservation this is a
+    no-op, so capture is never pinned onto a core shared with Gradio and the
+    recorder, or onto one excluded by taskset or a container cpuset. Linux only.
+    """
+    reserved = os.environ.get(RESERVED_CORE_ENV)
+    if not reserved or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        core = int(reserved)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", RESERVED_CORE_ENV, reserved)
+        return
+    try:
+        os.sched_setaffinity(0, {core})
+        logger.info("Capture thread pinned to CPU core %d", core)
+    except OSError as e:
+        logger.warning("Could not pin capture thread to CPU core %d: %s", core, e)
+
 
 class CaptureSession:
     """
@@ -63,41 +96,39 @@ class CaptureSession:
     def _capture_loop(self):
         """Infinite loop pulling frames from camera as fast as possible."""
         frame_count = 0
-        last_log_time = time.time()
+        # Monotonic integer ns: immune to wall-clock jumps, no float math per frame
+        last_log_ns = time.monotonic_ns()
 
+        _pin_to_reserved_core()
         logger.info("Capture loop started")
 
         while not self._stop_event.is_set():
             try:
-                # Check if camera is still initialized and valid
-                if not self.camera or not getattr(self.camera, "_initialized", False):
-                    time.sleep(0.1)
-                    continue
-
-                # Use a smaller timeout in capture_frames if possible,
-                # but currently it's hardcoded to 500ms in device.py.
-                # We iterate over the generator.
-                for frame in self.camera.capture_frames():
-                    if self._stop_event.is_set():
-                        break
-
-                    # If camera became uninitialized during iteration
+                # Call get_frame() directly rather than iterating capture_frames():
+                # no generator resume per frame, and timeouts/reconnects are
+                # handled inside get_frame() (returns None)
+                frame = self.camera.get_frame() if self.camera else None
+                if frame is None:
+                    # Back off while the camera is (re)initializing
                     if not getattr(self.camera, "_initialized", False):
-                        break
+                        time.sleep(0.1)
+                    continue
 
-                    # Push to recorder buffer
-                    self.recorder.add_frame(frame)
-                    frame_count += 1
+                # Push to recorder buffer
+                self.recorder.add_frame(frame)
+                frame_count += 1
 
-                    # Periodic logging of capture performance
-                    curr_time = time.time()
-                    if curr_time - last_log_time >= 5.0:
-                        fps = frame_count / (curr_time - last_log_time)
+                # Periodic logging of capture performance; only read the clock
+                # every 256 frames
+                if frame_count & 0xFF == 0:
+                    curr_ns = time.monotonic_ns()
+                    if curr_ns - last_log_ns >= 5_000_000_000:
+                        fps = frame_count * 1e9 / (curr_ns - last_log_ns)
                         logger.info(
                             f"Capture Thread: {fps:.1f} FPS sustained ({frame_count} frames)"
                         )
                         frame_count = 0
-                        last_log_time = curr_time
+                        last_log_ns = curr_ns
 
             except Exception as e:
                 if not self._stop_event.is_set():
@@ -135,12 +166,19 @@ def create_frame_generator(camera: Union[CameraDevice, WebcamDevice]) -> Iterato
         - Timeouts are normal, continue streaming
         - Other errors propagate to caller
     """
-    sequence = 0
+    # Bind hot globals/attributes to locals once (LOAD_FAST inside the loop)
+    timeout_code = mvsdk.CAMERA_STATUS_TIME_OUT
+    debug = logger.debug
 
     try:
-        for frame in camera.capture_frames():
-            sequence += 1
-            logger.debug(f"Frame captured: sequence={sequence}, shape={frame.shape}")
+        # Resolve the log level once; without DEBUG, delegate straight to the
+        # camera iterator instead of re-yielding each frame from a Python loop
+        if not (DEBUG_CAPTURE and logger.isEnabledFor(logging.DEBUG)):
+            yield from camera.capture_frames()
+            return
+
+        for sequence, frame in enumerate(camera.capture_frames(), 1):
+            debug("Frame captured: sequence=%d, shape=%s", sequence, frame.shape)
             yield frame
 
     except StopIteration:
@@ -148,8 +186,8 @@ def create_frame_generator(camera: Union[CameraDevice, WebcamDevice]) -> Iterato
 
     except CameraError as e:
         # Timeouts are expected, skip frame
-        if e.error_code == mvsdk.CAMERA_STATUS_TIME_OUT:
-            logger.debug("Frame timeout, continuing...")
+        if e.error_code == timeout_code:
+            debug("Frame timeout, continuing...")
             return
 
         # Other errors are fatal
@@ -22,11 +22,23 @@ Key features:
 """
 
 import logging
+import os
 import platform
+import re
+import tempfile
 import threading
 import time
 from dataclasses import dataclass
-from typing import Iterator, Optional
+from typing import IO, Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
 
 import numpy as np
 
@@ -34,12 +46,18 @@ from src.lib import mvsdk
 
 logger = logging.getLogger(__name__)
 
+# Alignment of the ISP output buffer (one memory page)
+FRAME_BUFFER_ALIGN = 4096
+
+# Windows requires a vertical flip (from research.md)
+_IS_WINDOWS = platform.system() == "Windows"
+
 # ------------------------------------------------------------------
 # Data Classes (from contract)
 # ------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraInfo:
     """Camera enumeration information"""
 
@@ -47,9 +65,10 @@ class CameraInfo:
     friendly_name: str
     port_type: str
     source_type: str = "mindvision"
+    serial_number: str = ""  # SDK serial; stable across replugs, unlike device_index
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CameraCapability:
     """Camera hardware capabilities"""
 
@@ -78,6 +97,69 @@ class CameraAccessDeniedError(CameraError):
     pass
 
 
+def _device_lock_key(camera_info: CameraInfo) -> str:
+    """
+    Name the cross-process lock for a camera.
+
+    Keyed on the serial number when the SDK reports one: enumeration indices
+    shift when cameras are replugged, so two processes could otherwise lock
+    different files for the same camera.
+    """
+    if camera_info.serial_number:
+        return "sn_" + re.sub(r"[^A-Za-z0-9_.-]", "_", camera_info.serial_number)
+    return f"idx_{camera_info.device_index}"
+
+
+def _lock_device_file(key: str) -> IO:
+    """
+    Take an exclusive, non-blocking OS file lock for a camera device.
+
+    The class-level _active_devices set only guards one process; this lock
+    also stops a second Python process from opening the same camera.
+
+    Args:
+        key: Lock name from _device_lock_key()
+
+    Returns:
+        The open lock file; keep it open to hold the lock
+
+    Raises:
+        CameraAccessDeniedError: Another process holds the device, or the lock
+            file can't be opened (e.g. left behind by another user)
+    """
+    path = os.path.join(tempfile.gettempdir(), f"mvsdk_{key}.lock")
+    try:
+        lock_file = open(path, "a+")
+    except OSError as e:
+        raise CameraAccessDeniedError(
+            f"Cannot open camera lock file {path}: {e}", error_code=-1
+        ) from e
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        raise CameraAccessDeniedError(
+            "Camera already in use by another process. Only one viewer allowed.", error_code=-1
+        )
+    return lock_file
+
+
+def _unlock_device_file(lock_file: IO) -> None:
+    """Release a lock taken by _lock_device_file() (closing drops a flock)."""
+    try:
+        if fcntl is None and msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError as e:
+        logger.warning("Failed to unlock camera device file: %s", e)
+    finally:
+        lock_file.close()
+
+
 # ------------------------------------------------------------------
 # CameraDevice Implementation
 # ------------------------------------------------------------------
@@ -114,11 +196,22 @@ class CameraDevice:
         self._handle: Optional[int] = None
         self._capability: Optional[mvsdk.tSdkCameraCapbility] = None
         self._frame_buffer = None
+        self._buffer_size = 0
+        self._np_buffer: Optional[np.ndarray] = None  # View over _frame_buffer
         self._is_mono = False
+        self._swap_rb = False  # True when the ISP only outputs BGR8 for this sensor
+        self._needs_flip = False  # Flip each frame on the CPU (ISP mirror unavailable)
         self._initialized = False
         # Thread safety
-        self._frame_lock = threading.RLock()  # Protect frame operations
+        # Protect frame operations. Always taken, even with a single frame
+        # consumer: __exit__ and the reconnect thread free the frame buffer
+        # under it while get_frame() may be inside the SDK on another thread.
+        self._frame_lock = threading.RLock()
         self._reconnect_in_progress = False  # Prevent concurrent reconnects
+        self._reconnect_lock = threading.Lock()  # Guards _reconnect_in_progress
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._closing = False  # Set by __exit__; an in-flight reconnect must not reopen
+        self._lock_file: Optional[IO] = None  # Cross-process device lock (see __enter__)
         # Timeout / reconnect state
         self._timeout_count = 0
         self._last_timeout_log_ts = 0.0
@@ -154,6 +247,7 @@ class CameraDevice:
                         device_index=i,
                         friendly_name=dev_info.GetFriendlyName(),
                         port_type=dev_info.GetPortType(),
+                        serial_number=dev_info.GetSn(),
                     )
                 )
 
@@ -190,6 +284,16 @@ class CameraDevice:
             max_fps=200.0,
         )
 
+    @property
+    def camera_info(self) -> CameraInfo:
+        """Camera this device was created for."""
+        return self._camera_info
+
+    @property
+    def is_initialized(self) -> bool:
+        """True while the camera is open and streaming."""
+        return self._initialized
+
     def info(self) -> str:
         """
         Get camera info string.
@@ -388,6 +492,40 @@ class CameraDevice:
             error_str = mvsdk.CameraGetErrorString(e.error_code)
             raise CameraError(f"Failed to set auto-exposure: {error_str}", e.error_code)
 
+    def pause_streaming(self) -> None:
+        """
+        Stop the sensor stream while keeping the device open.
+
+        Raises:
+            RuntimeError: Camera not initialized
+            CameraError: SDK call failed
+        """
+        if not self._initialized or self._handle is None:
+            raise RuntimeError("Camera not initialized. Call __enter__() first.")
+
+        # Unlike most SDK wrappers, CameraPause reports failure by return code only
+        status = mvsdk.CameraPause(self._handle)
+        if status != mvsdk.CAMERA_STATUS_SUCCESS:
+            error_str = mvsdk.CameraGetErrorString(status)
+            raise CameraError(f"Failed to pause camera: {error_str}", status)
+
+    def resume_streaming(self) -> None:
+        """
+        Restart a stream stopped with `pause_streaming()`.
+
+        Raises:
+            RuntimeError: Camera not initialized
+            CameraError: SDK call failed
+        """
+        if not self._initialized or self._handle is None:
+            raise RuntimeError("Camera not initialized. Call __enter__() first.")
+
+        # Unlike most SDK wrappers, CameraPlay reports failure by return code only
+        status = mvsdk.CameraPlay(self._handle)
+        if status != mvsdk.CAMERA_STATUS_SUCCESS:
+            error_str = mvsdk.CameraGetErrorString(status)
+            raise CameraError(f"Failed to resume camera: {error_str}", status)
+
     def __enter__(self) -> "CameraDevice":
         """
         Initialize camera and start streaming.
@@ -413,15 +551,25 @@ class CameraDevice:
                 )
             self._active_devices.add(self._camera_info.device_index)
 
+        self._closing = False
         try:
+            # Cross-process exclusion (the set above is the in-process fast path)
+            self._lock_file = _lock_device_file(_device_lock_key(self._camera_info))
             self._initialize()
             return self
         except Exception:
             # Cleanup on failure
+            self._release_device_lock()
             with self._access_lock:
                 self._active_devices.discard(self._camera_info.device_index)
             raise
 
+    def _release_device_lock(self) -> None:
+        """Drop the cross-process device lock, if held."""
+        if self._lock_file is not None:
+            _unlock_device_file(self._lock_file)
+            self._lock_file = None
+
     def _initialize(self) -> None:
         """
         Internal initialization sequence.
@@ -446,11 +594,28 @@ class CameraDevice:
             # 3. Determine mono vs color (FR-007)
             self._is_mono = self._capability.sIspCapacity.bMonoSensor != 0
 
-            # 4. Set output format based on camera type
+            # 4. Set output format based on camera type. Color cameras ask the ISP
+            # for RGB8 so frames need no channel swap; sensors that reject it fall
+            # back to BGR8 and the unpacker swaps channels with a view.
+            self._swap_rb = False
             if self._is_mono:
                 mvsdk.CameraSetIspOutFormat(self._handle, mvsdk.CAMERA_MEDIA_TYPE_MONO8)
-            else:
+            elif (
+                mvsdk.CameraSetIspOutFormat(self._handle, mvsdk.CAMERA_MEDIA_TYPE_RGB8)
+                != mvsdk.CAMERA_STATUS_SUCCESS
+            ):
+                logger.debug("ISP rejected RGB8 output, falling back to BGR8")
                 mvsdk.CameraSetIspOutFormat(self._handle, mvsdk.CAMERA_MEDIA_TYPE_BGR8)
+                self._swap_rb = True
+
+            self._unpack = self._make_unpacker()
+
+            # 4a. Windows needs a vertical flip: let the ISP mirror during
+            # CameraImageProcess, and only flip per frame if the sensor refuses
+            self._needs_flip = (
+                _IS_WINDOWS
+                and mvsdk.CameraSetMirror(self._handle, 1, 1) != mvsdk.CAMERA_STATUS_SUCCESS
+            )
 
             # 5. Set continuous capture mode (FR-003)
             mvsdk.CameraSetTriggerMode(self._handle, 0)
@@ -471,12 +636,17 @@ class CameraDevice:
                 * self._capability.sResolutionRange.iHeightMax
                 * channels
             )
-            self._frame_buffer = mvsdk.CameraAlignMalloc(buffer_size, 16)
+            # Page-aligned (4 KB) rather than the 16-byte SSE minimum: lets the ISP
+            # use wide/streaming stores and keeps the buffer off split pages
+            self._frame_buffer = mvsdk.CameraAlignMalloc(buffer_size, FRAME_BUFFER_ALIGN)
+            self._buffer_size = buffer_size
 
             # 7. Start streaming (FR-003, FR-009)
             mvsdk.CameraPlay(self._handle)
 
-            self._initialized = True
+            # 8. Publish the session; get_frame() checks this flag under the lock
+            with self._frame_lock:
+                self._initialized = True
 
         except mvsdk.CameraError as e:
             # Cleanup on initialization failure
@@ -485,6 +655,7 @@ class CameraDevice:
                     mvsdk.CameraUnInit(self._handle)
                 except Exception:
                     pass
+            self._np_buffer = None
             if self._frame_buffer is not None:
                 try:
                     mvsdk.CameraAlignFree(self._frame_buffer)
@@ -494,6 +665,93 @@ class CameraDevice:
             error_str = mvsdk.CameraGetErrorString(e.error_code)
             raise CameraError(f"Camera initialization failed: {error_str}", e.error_code)
 
+    def _make_unpacker(self) -> Callable[[np.ndarray, "mvsdk.tSdkFrameHead"], np.ndarray]:
+        """
+        Build the flat-buffer -> frame reshaper for this session.
+
+        The ISP output format (MONO8, RGB8 or BGR8) is fixed by _initialize(), so
+        it is captured once here instead of being re-checked on every frame.
+        Height and width still come from the frame head because set_roi() can
+        change them while streaming; the target shape tuple is cached and only
+        rebuilt when they change.
+        """
+        is_mono = self._is_mono
+        swap_rb = self._swap_rb
+        height = width = -1
+        shape: tuple[int, ...] = ()
+
+        def unpack(flat: np.ndarray, frame_head) -> np.ndarray:
+            nonlocal height, width, shape
+            h, w = frame_head.iHeight, frame_head.iWidth
+            if h != height or w != width:
+                # Mono: (H, W); color: (H, W, 3)
+                height, width = h, w
+                shape = (h, w) if is_mono else (h, w, 3)
+            frame = flat.reshape(shape)
+            # BGR8 fallback: convert BGR to RGB for Gradio with a view
+            return frame[..., ::-1] if swap_rb else frame
+
+        return unpack
+
+    def _bind_np_buffer(self) -> np.ndarray:
+        """
+        Wrap the whole aligned frame buffer in one NumPy view.
+
+        Built once per buffer allocation (on the first frame) so each frame only
+        slices a prefix, instead of constructing a ctypes array and a new
+        np.frombuffer view per frame.
+        """
+        frame_data = (mvsdk.c_ubyte * self._buffer_size).from_address(self._frame_buffer)
+        self._np_buffer = np.frombuffer(frame_data, dtype=np.uint8)
+        return self._np_buffer
+
+    def _read_frame(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Grab, ISP-process and unpack one frame (shared by capture_frames/get_frame).
+
+        Args:
+            out: Optional destination buffer; defaults to the session frame buffer
+
+        Returns:
+            np.ndarray: Frame view (H×W×C for color, H×W for mono)
+
+        Raises:
+            mvsdk.CameraError: SDK call failed (including timeout)
+            ValueError: ``out`` too small for the frame
+        """
+        # Get raw frame from camera (500ms timeout)
+        raw_data, frame_head = mvsdk.CameraGetImageBuffer(self._handle, 500)
+
+        # uBytes is the raw (Bayer) size until CameraImageProcess updates it, so
+        # size the ISP output from the frame geometry instead
+        frame_bytes = frame_head.iWidth * frame_head.iHeight * (1 if self._is_mono else 3)
+        if out is not None and out.nbytes < frame_bytes:
+            mvsdk.CameraReleaseImageBuffer(self._handle, raw_data)
+            raise ValueError(f"out buffer too small: {out.nbytes} bytes < {frame_bytes} bytes")
+        dst = self._frame_buffer if out is None else out.ctypes.data
+
+        # Process raw data to RGB/MONO format
+        mvsdk.CameraImageProcess(self._handle, raw_data, dst, frame_head)
+
+        # Release the raw buffer
+        mvsdk.CameraReleaseImageBuffer(self._handle, raw_data)
+
+        # Windows requires vertical flip (ISP mirror fallback, see _initialize)
+        if self._needs_flip:
+            mvsdk.CameraFlipFrameBuffer(dst, frame_head, 1)
+
+        # Convert to NumPy array (zero-copy using ctypes)
+        if out is not None:
+            flat = out.reshape(-1)[:frame_bytes]
+        else:
+            np_buffer = self._np_buffer
+            if np_buffer is None:
+                np_buffer = self._bind_np_buffer()
+            flat = np_buffer[:frame_bytes]
+
+        # Reshape based on camera type (FR-007)
+        return self._unpack(flat, frame_head)
+
     def capture_frames(self) -> Iterator[np.ndarray]:
         """
         Continuously yield frames from camera.
@@ -505,6 +763,10 @@ class CameraDevice:
             - FR-006: Must continuously update without manual refresh
             - Timeout allowed (skip frame), don't raise exception
             - Yields until camera error or __exit__()
+            - Zero-copy: each frame is a view over the session's aligned SDK buffer
+              (one np.frombuffer view bound per buffer), which the next frame overwrites.
+              Treat it as read-only and copy it before advancing the iterator if it
+              must outlive the current iteration (the recorders do this).
 
         Raises:
             RuntimeError: Camera not initialized
@@ -515,33 +777,7 @@ class CameraDevice:
 
         while self._initialized:
             try:
-                # Get raw frame from camera (500ms timeout)
-                raw_data, frame_head = mvsdk.CameraGetImageBuffer(self._handle, 500)
-
-                # Process raw data to RGB/MONO format
-                mvsdk.CameraImageProcess(self._handle, raw_data, self._frame_buffer, frame_head)
-
-                # Release the raw buffer
-                mvsdk.CameraReleaseImageBuffer(self._handle, raw_data)
-
-                # Windows requires vertical flip (from research.md)
-                if platform.system() == "Windows":
-                    mvsdk.CameraFlipFrameBuffer(self._frame_buffer, frame_head, 1)
-
-                # Convert to NumPy array (zero-copy using ctypes)
-                frame_data = (mvsdk.c_ubyte * frame_head.uBytes).from_address(self._frame_buffer)
-                frame = np.frombuffer(frame_data, dtype=np.uint8)
-
-                # Reshape based on camera type (FR-007)
-                if frame_head.uiMediaType == mvsdk.CAMERA_MEDIA_TYPE_MONO8:
-                    # Mono: (H, W)
-                    frame = frame.reshape((frame_head.iHeight, frame_head.iWidth))
-                else:
-                    # Color: (H, W, 3) - convert BGR to RGB for Gradio
-                    frame = frame.reshape((frame_head.iHeight, frame_head.iWidth, 3))
-                    frame = frame[..., ::-1]  # BGR -> RGB
-
-                yield frame
+                yield self._read_frame()
 
             except mvsdk.CameraError as e:
                 # Timeout is expected and normal (FR-006 contract)
@@ -591,15 +827,43 @@ class CameraDevice:
             - Must call SDK cleanup functions
             - Must not raise exceptions (log errors only)
         """
+        # Stop reconnects from reopening the camera, then wait for an in-flight
+        # one: it returns as soon as its current SDK call does, so the camera is
+        # released before __exit__ returns
+        with self._reconnect_lock:
+            self._closing = True
+        reconnect_thread = self._reconnect_thread
+        if reconnect_thread is not None and reconnect_thread is not threading.current_thread():
+            reconnect_thread.join()
+
+        with self._frame_lock:
+            self._teardown_session()
+
+        # Release access lock (FR-005: make available for other apps)
+        self._release_device_lock()
+        with self._access_lock:
+            self._active_devices.discard(self._camera_info.device_index)
+
+        # Don't suppress exceptions (return None)
+        return None
+
+    def _teardown_session(self) -> None:
+        """
+        Free the frame buffer and uninitialize the SDK handle, if present.
+
+        Contract:
+            - Must not raise exceptions (log errors only)
+        """
         self._initialized = False
 
         # Release frame buffer
+        self._np_buffer = None
         if self._frame_buffer is not None:
             try:
                 mvsdk.CameraAlignFree(self._frame_buffer)
             except Exception as e:
                 # Log but don't raise (contract requirement)
-                print(f"Warning: Failed to free frame buffer: {e}")
+                logger.warning("Failed to free frame buffer: %s", e)
             finally:
                 self._frame_buffer = None
 
@@ -609,17 +873,10 @@ class CameraDevice:
                 mvsdk.CameraUnInit(self._handle)
             except Exception as e:
                 # Log but don't raise (contract requirement)
-                print(f"Warning: Failed to uninitialize camera: {e}")
+                logger.warning("Failed to uninitialize camera: %s", e)
             finally:
                 self._handle = None
 
-        # Release access lock (FR-005: make available for other apps)
-        with self._access_lock:
-            self._active_devices.discard(self._camera_info.device_index)
-
-        # Don't suppress exceptions (return None)
-        return None
-
     def _attempt_reconnect(self) -> bool:
         """
         Attempt to reconnect to the camera after consecutive timeouts.
@@ -632,58 +889,107 @@ class CameraDevice:
         # Record attempt timestamp (in case called from other places)
         self._last_reconnect_attempt = time.time()
 
-        # Clean up existing connection
-        if self._frame_buffer is not None:
-            try:
-                mvsdk.CameraAlignFree(self._frame_buffer)
-            except Exception as e:
-                logger.warning(f"Error freeing buffer during reconnect: {e}")
-            finally:
-                self._frame_buffer = None
-
-        if self._handle is not None:
-            try:
-                mvsdk.CameraUnInit(self._handle)
-            except Exception as e:
-                logger.warning(f"Error uninitializing camera during reconnect: {e}")
-            finally:
-                self._handle = None
-
-        # Mark as not initialized after cleanup
-        self._initialized = False
+        # Clean up existing connection (also marks the camera not initialized).
+        # Teardown holds the frame lock so get_frame() never reads a freed buffer
+        with self._frame_lock:
+            if self._closing:
+                return False
+            self._teardown_session()
 
         # Wait before reconnecting (backoff)
         time.sleep(self._reconnect_backoff_seconds)
+        if self._closing:
+            return False
 
-        # Re-initialize the camera
+        # Re-initialize the camera without the frame lock: CameraInit can take
+        # seconds, and get_frame() keeps returning None until _initialize()
+        # publishes _initialized under the lock
         try:
             self._initialize()
-            logger.info("Camera reconnection successful")
-            return True
         except CameraError as e:
             logger.error(f"Camera reconnection failed: {e}")
             # Keep initialized=False and return failure
             # Caller will handle this by returning None
             return False
+        if self._closing:
+            # __exit__ is waiting on this thread and tears the new session down
+            return False
+        logger.info("Camera reconnection successful")
+        return True
+
+    def _start_background_reconnect(self) -> bool:
+        """
+        Run _attempt_reconnect() on a one-shot daemon thread.
+
+        The backoff sleep and re-initialization take seconds; running them off
+        the caller's thread lets get_frame() keep returning None immediately
+        instead of stalling the capture loop.
 
-    def get_frame(self) -> Optional[np.ndarray]:
+        Returns:
+            bool: True if a reconnect was started, False if one is already running
+        """
+        with self._reconnect_lock:
+            if self._reconnect_in_progress:
+                return False
+            self._reconnect_in_progress = True
+
+        # Stop capture paths from touching the handle before cleanup starts
+        self._initialized = False
+        self._reconnect_thread = threading.Thread(
+            target=self._reconnect_worker, name="CameraReconnect", daemon=True
+        )
+        self._reconnect_thread.start()
+        return True
+
+    def _reconnect_worker(self) -> None:
+        """Body of the background reconnect thread."""
+        try:
+            if self._attempt_reconnect():
+                self._timeout_count = 0
+                logger.info("Reconnect successful, camera reinitialized")
+            else:
+                logger.warning(
+                    "Reconnect failed, will retry in %.0fs", self._min_reconnect_interval
+                )
+        finally:
+            with self._reconnect_lock:
+                self._reconnect_in_progress = False
+
+    def get_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Get a single frame from the camera (thread-safe).
 
+        Args:
+            out: Optional caller-owned uint8 C-contiguous buffer. When given, the
+                ISP writes pixels straight into it and the returned frame is a
+                view of ``out``. Callers SHOULD reuse one buffer across calls to
+                avoid per-frame allocation at high frame rates. ``out`` may wrap a
+                multiprocessing.shared_memory.SharedMemory segment
+                (``np.ndarray(shape, np.uint8, buffer=shm.buf)``), so another
+                process can map the frame without an IPC copy.
+
         Returns:
-            np.ndarray: Frame data (H×W×C for color, H×W for mono)
+            np.ndarray: Frame data (H×W×C for color, H×W for mono). Without
+                ``out`` this aliases the SDK frame buffer and is overwritten by
+                the next capture (same contract as capture_frames()).
             None: If camera not initialized or timeout
 
         Raises:
             CameraError: Frame capture failed (non-timeout error)
+            ValueError: ``out`` is not a contiguous uint8 buffer large enough for the frame
         """
+        if out is not None and (out.dtype != np.uint8 or not out.flags.c_contiguous):
+            raise ValueError("out must be a C-contiguous uint8 array")
         with self._frame_lock:
-            return self._get_frame_locked()
+            return self._get_frame_locked(out)
 
-    def _get_frame_locked(self) -> Optional[np.ndarray]:
+    def _get_frame_locked(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Internal frame capture (called under lock).
 
+        Args:
+            out: Optional destination buffer (validated by get_frame)
+
         Returns:
             np.ndarray: Frame data or None on timeout
         """
@@ -697,53 +1003,17 @@ class CameraDevice:
             time_since_last_attempt = now - self._last_reconnect_attempt
 
             if time_since_last_attempt >= self._min_reconnect_interval:
-                self._reconnect_in_progress = True
-                try:
-                    logger.warning(
-                        "Camera not initialized, attempting reconnect (%.1fs since last attempt)",
-                        time_since_last_attempt,
-                    )
-
-                    if self._attempt_reconnect():
-                        self._timeout_count = 0
-                        logger.info("Reconnect successful, camera reinitialized")
-                    else:
-                        logger.warning(
-                            "Reconnect failed, will retry in %.0fs", self._min_reconnect_interval
-                        )
-                finally:
-                    self._reconnect_in_progress = False
+                logger.warning(
+                    "Camera not initialized, attempting reconnect (%.1fs since last attempt)",
+                    time_since_last_attempt,
+                )
+                self._start_background_reconnect()
 
-            # Return None (don't recurse - let next call succeed if reconnect worked)
+            # Return None (don't block - let a later call succeed once reconnect is done)
             return None
 
         try:
-            # Get raw frame from camera (500ms timeout)
-            raw_data, frame_head = mvsdk.CameraGetImageBuffer(self._handle, 500)
-
-            # Process raw data to RGB/MONO format
-            mvsdk.CameraImageProcess(self._handle, raw_data, self._frame_buffer, frame_head)
-
-            # Release the raw buffer
-            mvsdk.CameraReleaseImageBuffer(self._handle, raw_data)
-
-            # Windows requires vertical flip
-            if platform.system() == "Windows":
-                mvsdk.CameraFlipFrameBuffer(self._frame_buffer, frame_head, 1)
-
-            # Convert to NumPy array
-            frame_data = (mvsdk.c_ubyte * frame_head.uBytes).from_address(self._frame_buffer)
-            frame = np.frombuffer(frame_data, dtype=np.uint8)
-
-            # Reshape based on camera type
-            if frame_head.uiMediaType == mvsdk.CAMERA_MEDIA_TYPE_MONO8:
-                frame = frame.reshape((frame_head.iHeight, frame_head.iWidth))
-            else:
-                # Color: convert BGR to RGB
-                frame = frame.reshape((frame_head.iHeight, frame_head.iWidth, 3))
-                frame = frame[..., ::-1]  # BGR -> RGB
-
-            return frame
+            return self._read_frame(out)
 
         except mvsdk.CameraError as e:
             # Treat timeout as non-fatal for single-frame capture: return None
@@ -761,14 +1031,9 @@ class CameraDevice:
                         "Consecutive timeouts (%d) reached in get_frame(); attempting reconnect",
                         self._timeout_count,
                     )
-                    if self._attempt_reconnect():
-                        # Reset counter on successful reconnect
-                        self._timeout_count = 0
-                        logger.info("Reconnect successful in get_frame()")
-                    else:
-                        # Reconnect failed - reset counter to allow retry later
-                        self._timeout_count = 0
-                        logger.warning("Reconnect failed in get_frame(), will retry later")
+                    # Reset counter so a failed reconnect is retried after the next run
+                    self._timeout_count = 0
+                    self._start_background_reconnect()
 
                 return None
             error_str = mvsdk.CameraGetErrorString(e.error_code)
@@ -11,18 +11,272 @@ Example:
 """
 
 import logging
+import multiprocessing
+import os
 import threading
 import time
-from collections import deque
-from datetime import datetime
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Sequence
 
 import cv2
 import numpy as np
 
+from src.camera.video_writer import VIDEO_CODECS, open_video_writer, write_frames
+
 logger = logging.getLogger(__name__)
 
+# Frame timestamps used for the measured FPS
+_FPS_WINDOW = 60
+
+# Ring storage layouts for color frames
+FRAME_FORMATS = ("rgb", "yuv420p")
+
+# tmpfs backing multiprocessing.shared_memory on Linux (64 MB by default in Docker)
+_SHM_DIR = "/dev/shm"
+
+
+def _slowmo_filename(capture_fps: float, slowmo_factor: float) -> str:
+    """
+    Auto-generated slow-mo clip name, e.g. ``slowmo_120fps_4.0x_20240101_120000.mp4``.
+
+    Args:
+        capture_fps: Measured capture frame rate
+        slowmo_factor: Capture FPS / playback FPS
+
+    Returns:
+        File name (no directory)
+    """
+    return "slowmo_%dfps_%.1fx_%s.mp4" % (
+        capture_fps,
+        slowmo_factor,
+        time.strftime("%Y%m%d_%H%M%S"),
+    )
+
+
+def _completed(value: Any) -> Future:
+    """Future that is already resolved to value."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _shm_free_bytes() -> Optional[int]:
+    """
+    Free space on /dev/shm, where SharedMemory blocks live on Linux.
+
+    Returns:
+        Free bytes, or None where there is no /dev/shm to run out of
+        (macOS, Windows)
+    """
+    try:
+        stat = os.statvfs(_SHM_DIR)
+    except (AttributeError, OSError):
+        return None
+    return stat.f_bavail * stat.f_frsize
+
+
+def _encode_frames(
+    frames: Sequence[np.ndarray],
+    output_path: Path,
+    playback_fps: float,
+    codec: str = "auto",
+    yuv420p: bool = False,
+) -> bool:
+    """
+    Encode frames to a video file at the playback frame rate.
+
+    Args:
+        frames: RGB (H×W×3), mono (H×W) or I420 ((H·3/2)×W) frames, all the same shape
+        output_path: Output file path
+        playback_fps: Playback frame rate (determines slow-mo factor)
+        codec: Encoder choice (see video_writer.VIDEO_CODECS)
+        yuv420p: Frames are color stored as planar I420
+
+    Returns:
+        True if successful
+    """
+    # Get frame dimensions
+    first_frame = frames[0]
+    if yuv420p:
+        height, width = first_frame.shape[0] * 2 // 3, first_frame.shape[1]
+        is_color = True
+    else:
+        height, width = first_frame.shape[:2]
+        is_color = len(first_frame.shape) == 3 and first_frame.shape[2] == 3
+
+    # Hardware H.264 when available, OpenCV mp4v otherwise
+    opened = open_video_writer(output_path, playback_fps, (width, height), is_color, codec)
+
+    if opened is None:
+        logger.error(f"Failed to open video writer for {output_path}")
+        return False
+    writer, pix_fmt = opened
+
+    try:
+        write_frames(writer, pix_fmt, frames, is_color, yuv420p)
+        return True
+    finally:
+        writer.release()
+
+
+def _encode_worker(
+    shm_name: str,
+    shape: tuple[int, ...],
+    start: int,
+    dtype: str,
+    output_path: str,
+    playback_fps: float,
+    codec: str,
+    yuv420p: bool,
+) -> bool:
+    """
+    Encode-pool entry point: encode frames staged in shared memory.
+
+    Args:
+        shm_name: SharedMemory block holding the (N, H, W[, C]) frame stack
+        shape: Frame stack shape
+        start: Index of the first frame to encode
+        dtype: Frame dtype string
+        output_path: Output file path
+        playback_fps: Playback frame rate
+        codec: Encoder choice
+        yuv420p: Frames are color stored as planar I420
+
+    Returns:
+        True if successful
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames = np.ndarray(shape, dtype=dtype, buffer=shm.buf)[start:]
+        success = _encode_frames(frames, Path(output_path), playback_fps, codec, yuv420p)
+        del frames  # Drop the buffer export so the block can be closed
+        return success
+    finally:
+        shm.close()
+
+
+class _FrameRing:
+    """
+    Preallocated frame ring written by a single producer thread without locks.
+
+    The producer copies a frame into slot ``written % capacity`` and only then
+    publishes it by storing ``written + 1`` (a single attribute store, atomic
+    under the GIL). Readers take ``written`` as their acquire point, copy the
+    slots out, and re-read ``written`` to discard any frame the producer may
+    have overwritten during the copy. One spare slot keeps the slot being
+    written disjoint from the ``max_frames`` published ones.
+
+    Color frames can be stored as planar I420 ((H·3/2)×W, half the bytes of RGB),
+    converted on push.
+    """
+
+    __slots__ = ("capacity", "frames", "timestamps", "written", "start", "shape", "yuv420p")
+
+    def __init__(
+        self, max_frames: int, shape: tuple[int, ...], dtype: np.dtype, yuv420p: bool = False
+    ):
+        self.capacity = max_frames + 1
+        self.shape = shape  # Shape of the frames pushed (H×W×3 / H×W)
+        self.yuv420p = yuv420p
+        if yuv420p:
+            shape = (shape[0] * 3 // 2, shape[1])
+        self.frames = np.empty((self.capacity, *shape), dtype=dtype)
+        self.timestamps = np.empty(self.capacity, dtype=np.float64)
+        self.written = 0  # Sequence number of the next frame (frames published so far)
+        self.start = 0  # First sequence still buffered (advanced by clear_buffer)
+
+    def push(self, frame: np.ndarray, timestamp: float) -> None:
+        """Copy a frame into the next slot and publish it (producer thread only)."""
+        seq = self.written
+        slot = seq % self.capacity
+        if self.yuv420p:
+            cv2.cvtColor(frame, cv2.COLOR_RGB2YUV_I420, dst=self.frames[slot])
+        else:
+            np.copyto(self.frames[slot], frame)
+        self.timestamps[slot] = timestamp
+        self.written = seq + 1  # Release: the slot is complete before it is visible
+
+    def count(self, written: int) -> int:
+        """Number of buffered frames as of the given ``written`` value."""
+        return max(0, min(written - self.start, self.capacity - 1))
+
+    def select(self, duration_sec: Optional[float] = None) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Choose the buffered frames to copy out, oldest first, without copying them.
+
+        Args:
+            duration_sec: Only select frames within this long of the newest (None = all)
+
+        Returns:
+            (first, slots, timestamps): sequence number of the first selected
+            frame, its ring slot indices and their timestamps
+        """
+        written = self.written
+        first = written - self.count(written)
+        slots = np.arange(first, written) % self.capacity
+        timestamps = self.timestamps[slots]
+        if duration_sec is not None and len(timestamps):
+            # Timestamps are ascending: binary-search the cutoff before copying frames
+            skip = int(np.searchsorted(timestamps, timestamps[-1] - duration_sec))
+            first += skip
+            slots, timestamps = slots[skip:], timestamps[skip:]
+        return first, slots, timestamps
+
+    def gather(
+        self, first: int, slots: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, int]:
+        """
+        Copy selected slots out (into ``out`` if given).
+
+        Returns:
+            (frames, torn): the copied frames and how many leading ones the
+            producer overwrote during the copy and must be discarded
+        """
+        # mode="clip" (slots are always in range) lets np.take write into out
+        # directly; the default mode buffers the whole result first
+        frames = np.take(self.frames, slots, axis=0, out=out, mode="clip")
+        # The producer may have overwritten (or be overwriting) every sequence up
+        # to its current position minus capacity since the acquire point
+        return frames, max(0, self.written - self.capacity + 1 - first)
+
+    def snapshot(self, duration_sec: Optional[float] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Copy the buffered frames out, oldest first.
+
+        Args:
+            duration_sec: Only copy frames within this long of the newest (None = all)
+
+        Returns:
+            (timestamps, frames) arrays; frames overwritten mid-copy are dropped
+        """
+        first, slots, timestamps = self.select(duration_sec)
+        frames, torn = self.gather(first, slots)
+        return timestamps[torn:], frames[torn:]
+
+    def accepts(self, frame: np.ndarray) -> bool:
+        """True if frame matches the shape and dtype this ring was allocated for."""
+        return frame.shape == self.shape and frame.dtype == self.frames.dtype
+
+    def latest(self) -> Optional[np.ndarray]:
+        """
+        Read-only view of the newest frame, or None before the first frame.
+
+        The slot is not rewritten until ``capacity - 1`` more frames are pushed.
+        I420 rings return a converted RGB copy instead.
+        """
+        written = self.written
+        if written == 0:
+            return None
+        if self.yuv420p:
+            return cv2.cvtColor(self.frames[(written - 1) % self.capacity], cv2.COLOR_YUV2RGB_I420)
+        frame = self.frames[(written - 1) % self.capacity].view()
+        frame.flags.writeable = False
+        return frame
+
 
 class HighSpeedRecorder:
     """
@@ -33,7 +287,7 @@ class HighSpeedRecorder:
     - Circular buffer maintaining last N seconds at capture rate
     - Slow-motion video output (playback at 30fps regardless of capture rate)
     - Real-time FPS measurement
-    - Thread-safe operation
+    - Thread-safe operation (lock-free add_frame for the single capture thread)
 
     Usage:
         recorder = HighSpeedRecorder(target_fps=120, buffer_duration_sec=3.0)
@@ -54,6 +308,10 @@ class HighSpeedRecorder:
         buffer_duration_sec: float = 5.0,
         output_dir: str = "./clips",
         playback_fps: float = 30.0,
+        encode_workers: int = 0,
+        codec: str = "auto",
+        frame_format: str = "rgb",
+        max_slowmo_factor: Optional[float] = None,
     ):
         """
         Initialize high-speed recorder.
@@ -63,28 +321,73 @@ class HighSpeedRecorder:
             buffer_duration_sec: Maximum buffer duration in seconds
             output_dir: Directory for saving video clips
             playback_fps: Default playback frame rate for slow-motion output
+            encode_workers: Processes for clip encoding (0 = encode in the calling
+                thread). Clips are staged in /dev/shm for the workers.
+            codec: Clip encoder: "auto" (NVENC → V4L2 M2M / OMX on ARM Linux → mp4v),
+                "nvenc", "v4l2m2m", "omx" or "mp4v"
+            frame_format: Ring storage for color frames: "rgb", or "yuv420p" to
+                store planar I420 (half the memory, no conversion for the NVENC
+                pipe; preview frames are converted back on request). Mono and
+                odd-sized frames are always stored as-is.
+            max_slowmo_factor: Highest slow-mo factor clips need (None = keep every
+                frame). When the camera delivers more than playback_fps ×
+                max_slowmo_factor, only every k-th frame is stored.
+
+        Raises:
+            ValueError: If codec or frame_format is not recognized
         """
+        if codec not in VIDEO_CODECS:
+            raise ValueError(f"Unknown codec {codec!r}, expected one of {VIDEO_CODECS}")
+        if frame_format not in FRAME_FORMATS:
+            raise ValueError(
+                f"Unknown frame_format {frame_format!r}, expected one of {FRAME_FORMATS}"
+            )
         self.target_fps = target_fps
         self.buffer_duration_sec = buffer_duration_sec
         self.output_dir = Path(output_dir)
         self.playback_fps = playback_fps
 
-        # Calculate max buffer size based on target FPS and duration
-        self._max_frames = int(target_fps * buffer_duration_sec * 1.2)  # 20% headroom
+        # Optional clip encoding in worker processes, so it doesn't compete with
+        # the capture thread for the GIL; the pool is started on the first save
+        self._encode_workers = encode_workers
+        self.codec = codec
+        self.frame_format = frame_format
+
+        # Capture decimation (max_slowmo_factor): store every k-th frame, with k
+        # re-derived from the measured FPS once per second by the capture thread
+        self.max_slowmo_factor = max_slowmo_factor
+        self._decimation = 1
+        self._decimation_count = 0
+        self._decimation_update_at = 0.0
+        self._encode_pool: Optional[ProcessPoolExecutor] = None
 
-        # Frame buffer: [(timestamp, frame), ...]
-        self._buffer: deque = deque(maxlen=self._max_frames)
+        # Calculate max buffer size based on target FPS and duration
+        self._max_frames = max(1, int(target_fps * buffer_duration_sec * 1.2))  # 20% headroom
+
+        # Frame ring buffer: one preallocated (N, H, W[, C]) block plus parallel
+        # timestamps, overwritten in place by the capture thread without locking.
+        # Allocated lazily on the first add_frame() because the frame shape is not
+        # known until then; replaced wholesale on resize or resolution change.
+        self._ring: Optional[_FrameRing] = None
+        # Serializes reader/control threads with each other (never taken by add_frame)
         self._lock = threading.RLock()
 
         # FPS measurement
-        self._fps_window: deque = deque(maxlen=60)  # Last 60 frame timestamps
-        self._last_fps_calc = 0.0
-        self._cached_fps = 0.0
+        # Last _FPS_WINDOW frame timestamps in a preallocated ring written by the
+        # capture thread (spare slot so the oldest entry isn't overwritten mid-read)
+        self._fps_ts = np.empty(_FPS_WINDOW + 1, dtype=np.float64)
+        self._fps_written = 0  # Timestamps ever written (published after the store)
+        self._fps_start = 0  # First timestamp in the window (advanced by clear_buffer)
+        # (calc_time, fps), replaced as one tuple so readers never see a torn pair
+        self._fps_cache = (0.0, 0.0)
 
         # Recording state
         self._is_recording = False
         self._recording_start_time = 0.0
-        self._recording_frames: list = []
+        # Recording buffer as parallel (frames, timestamps) containers rather than
+        # per-frame (timestamp, frame) tuples; swapped as one pair. Frames are
+        # appended before their timestamp, so len(timestamps) frames are complete.
+        self._recording: tuple[list[np.ndarray], array] = ([], array("d"))
 
         # Latest frame for preview sampling
         self._latest_frame: Optional[np.ndarray] = None
@@ -101,45 +404,104 @@ class HighSpeedRecorder:
         """
         with self._lock:
             self.target_fps = fps
-            new_max = int(fps * self.buffer_duration_sec * 1.2)
-            # Recreate buffer with new max size
-            old_frames = list(self._buffer)
-            self._buffer = deque(old_frames, maxlen=new_max)
+            new_max = max(1, int(fps * self.buffer_duration_sec * 1.2))
+            self._max_frames = new_max
+            old = self._ring
+            if old is not None:
+                # Build a new ring holding the newest frames that still fit, then
+                # publish it. Frames the capture thread adds to the old ring in
+                # between are dropped.
+                timestamps, frames = old.snapshot()
+                kept = min(len(frames), new_max)
+                ring = _FrameRing(new_max, old.shape, old.frames.dtype, old.yuv420p)
+                if kept:
+                    ring.frames[:kept] = frames[-kept:]
+                    ring.timestamps[:kept] = timestamps[-kept:]
+                ring.written = kept
+                self._ring = ring
             logger.info(f"Target FPS updated to {fps}, buffer resized to {new_max} frames")
 
     def add_frame(self, frame: np.ndarray) -> None:
         """
         Add frame to buffer with timestamp.
 
+        Called from the single capture thread only; takes no lock.
+
         Args:
             frame: Frame data (H×W×C RGB or H×W mono)
         """
         current_time = time.time()
-        frame_copy = frame.copy()
 
-        with self._lock:
-            # Update latest frame for preview
-            self._latest_frame = frame_copy
+        # Update FPS measurement window (every delivered frame, stored or not)
+        n = self._fps_written
+        self._fps_ts[n % (_FPS_WINDOW + 1)] = current_time
+        self._fps_written = n + 1
 
-            # Add to circular buffer
-            self._buffer.append((current_time, frame_copy))
+        if self.max_slowmo_factor is not None and self._skip_frame(current_time):
+            return
 
-            # Update FPS measurement window
-            self._fps_window.append(current_time)
+        ring = self._ring
+        if ring is None or not ring.accepts(frame):
+            # First frame or resolution change: allocate and publish a new ring
+            ring = self._ring = _FrameRing(
+                self._max_frames, frame.shape, frame.dtype, self._store_yuv420p(frame)
+            )
 
-            # If actively recording, also store in recording buffer
-            if self._is_recording:
-                self._recording_frames.append((current_time, frame_copy))
+        # Copy (or convert) into the oldest slot in place (no per-frame allocation)
+        ring.push(frame, current_time)
+
+        # If actively recording, also store in recording buffer (the recording
+        # can outlast the ring, so it keeps its own copy)
+        if self._is_recording:
+            frames, timestamps = self._recording
+            frames.append(frame.copy())
+            timestamps.append(current_time)
+
+    def _skip_frame(self, current_time: float) -> bool:
+        """
+        Decide whether to drop this frame to stay within max_slowmo_factor.
+
+        Args:
+            current_time: Frame timestamp
+
+        Returns:
+            True if the frame should not be stored
+        """
+        if current_time >= self._decimation_update_at:
+            self._decimation_update_at = current_time + 1.0
+            max_fps = self.playback_fps * self.max_slowmo_factor
+            self._decimation = max(1, int(self.get_actual_fps() / max_fps)) if max_fps > 0 else 1
+
+        self._decimation_count += 1
+        if self._decimation_count < self._decimation:
+            return True
+        self._decimation_count = 0
+        return False
+
+    def _store_yuv420p(self, frame: np.ndarray) -> bool:
+        """True if frames like this one are stored as I420 (even-sized uint8 RGB)."""
+        return (
+            self.frame_format == "yuv420p"
+            and frame.ndim == 3
+            and frame.shape[2] == 3
+            and frame.dtype == np.uint8
+            and frame.shape[0] % 2 == 0
+            and frame.shape[1] % 2 == 0
+        )
 
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """
         Get the most recent frame for UI display (thread-safe sampling).
 
+        Returns a read-only view into the frame ring instead of a copy: the slot
+        is published and won't be overwritten until the ring wraps (about one
+        buffer duration at the target FPS). Copy it to hold it longer.
+
         Returns:
             np.ndarray or None
         """
-        with self._lock:
-            return self._latest_frame.copy() if self._latest_frame is not None else None
+        ring = self._ring
+        return ring.latest() if ring is not None else None
 
     def get_actual_fps(self) -> float:
         """
@@ -150,26 +512,26 @@ class HighSpeedRecorder:
         """
         current_time = time.time()
 
-        # Cache FPS calculation (update at most every 0.2 seconds)
-        if current_time - self._last_fps_calc < 0.2:
-            return self._cached_fps
-
-        with self._lock:
-            if len(self._fps_window) < 2:
-                return 0.0
+        # Cache FPS calculation (update at most every 0.2 seconds). Lock-free: the
+        # cache is a single attribute and the window is published by the capture
+        # thread, so concurrent callers at worst recompute the same value.
+        calc_time, fps = self._fps_cache
+        if current_time - calc_time < 0.2:
+            return fps
 
-            # Calculate FPS from timestamp window
-            oldest = self._fps_window[0]
-            newest = self._fps_window[-1]
-            time_span = newest - oldest
+        written = self._fps_written
+        count = min(written - self._fps_start, _FPS_WINDOW)
+        if count < 2:
+            return 0.0
 
-            if time_span > 0:
-                self._cached_fps = (len(self._fps_window) - 1) / time_span
-            else:
-                self._cached_fps = 0.0
+        # Calculate FPS from timestamp window
+        oldest = self._fps_ts[(written - count) % (_FPS_WINDOW + 1)]
+        newest = self._fps_ts[(written - 1) % (_FPS_WINDOW + 1)]
+        time_span = float(newest - oldest)
+        fps = (count - 1) / time_span if time_span > 0 else 0.0
 
-            self._last_fps_calc = current_time
-            return self._cached_fps
+        self._fps_cache = (current_time, fps)
+        return fps
 
     def get_buffer_stats(self) -> dict:
         """
@@ -179,13 +541,15 @@ class HighSpeedRecorder:
             Dict with frame_count, duration_sec, actual_fps, slowmo_factor
         """
         with self._lock:
-            frame_count = len(self._buffer)
+            ring = self._ring
+            frame_count = ring.count(ring.written) if ring is not None else 0
             actual_fps = self.get_actual_fps()
 
             if frame_count >= 2:
-                oldest = self._buffer[0][0]
-                newest = self._buffer[-1][0]
-                duration = newest - oldest
+                written = ring.written
+                oldest = ring.timestamps[(written - frame_count) % ring.capacity]
+                newest = ring.timestamps[(written - 1) % ring.capacity]
+                duration = float(newest - oldest)
             else:
                 duration = 0.0
 
@@ -209,7 +573,7 @@ class HighSpeedRecorder:
         with self._lock:
             self._is_recording = True
             self._recording_start_time = time.time()
-            self._recording_frames = []
+            self._recording = ([], array("d"))
             logger.info("High-speed recording started")
 
     def stop_recording(self) -> int:
@@ -221,7 +585,7 @@ class HighSpeedRecorder:
         """
         with self._lock:
             self._is_recording = False
-            frame_count = len(self._recording_frames)
+            frame_count = len(self._recording[1])
             logger.info(f"High-speed recording stopped: {frame_count} frames")
             return frame_count
 
@@ -236,7 +600,8 @@ class HighSpeedRecorder:
         Save buffered frames as slow-motion video.
 
         The video is saved at playback_fps (default 30), so if captured at 120fps,
-        the resulting video plays at 4x slow motion.
+        the resulting video plays at 4x slow motion. Blocks until the clip is
+        written; see save_slowmo_clip_async() to return once frames are staged.
 
         Args:
             duration_sec: Duration of source footage to save (None = all)
@@ -247,109 +612,269 @@ class HighSpeedRecorder:
         Returns:
             Path to saved video file, or None if failed
         """
+        return self.save_slowmo_clip_async(
+            duration_sec, playback_fps, filename, use_recording_buffer
+        ).result()
+
+    def save_slowmo_clip_async(
+        self,
+        duration_sec: Optional[float] = None,
+        playback_fps: Optional[float] = None,
+        filename: Optional[str] = None,
+        use_recording_buffer: bool = False,
+    ) -> "Future[Optional[str]]":
+        """
+        Stage buffered frames and encode them as slow-motion video.
+
+        Frames are copied out of the ring before this returns (the ring keeps
+        being overwritten). With encode_workers > 0 the encode then runs in the
+        process pool and the future completes when it finishes; otherwise the
+        clip is encoded in the calling thread and the future is already done.
+
+        Args:
+            Same as save_slowmo_clip()
+
+        Returns:
+            Future resolving to the saved video path, or None if failed
+        """
         if playback_fps is None:
             playback_fps = self.playback_fps
 
         with self._lock:
-            # Select frame source
-            if use_recording_buffer and self._recording_frames:
-                source_frames = self._recording_frames.copy()
+            # Select frames; they are copied once, straight into the encode buffer.
+            # Ring frames stay in place until then (the ring applies the duration
+            # filter itself).
+            ring = self._ring
+            if use_recording_buffer and len(self._recording[1]):
+                recorded_frames, recorded_timestamps = self._recording
+                # Slice (copy) the array first: a buffer export would block appends
+                timestamps = np.frombuffer(recorded_timestamps[:], dtype=np.float64)
+                frames = recorded_frames[: len(timestamps)]
+                if len(frames) >= 2 and duration_sec is not None:
+                    skip = int(np.searchsorted(timestamps, timestamps[-1] - duration_sec))
+                    timestamps, frames = timestamps[skip:], frames[skip:]
+                frame_shape, dtype = frames[0].shape, frames[0].dtype
+                yuv420p = False
+
+                def fill(out: np.ndarray) -> int:
+                    np.stack(frames, out=out)
+                    return 0
+
+            elif ring is not None:
+                first, slots, timestamps = ring.select(duration_sec)
+                frame_shape, dtype = ring.frames.shape[1:], ring.frames.dtype
+                yuv420p = ring.yuv420p
+
+                def fill(out: np.ndarray) -> int:
+                    return ring.gather(first, slots, out)[1]
+
             else:
-                source_frames = list(self._buffer)
+                timestamps = np.empty(0)
 
-            if len(source_frames) < 2:
+            frame_count = len(timestamps)
+            if frame_count < 2:
                 logger.warning("Insufficient frames for slow-mo clip")
-                return None
-
-            # Filter by duration if specified
-            if duration_sec is not None:
-                cutoff_time = source_frames[-1][0] - duration_sec
-                source_frames = [(ts, f) for ts, f in source_frames if ts >= cutoff_time]
-
-            if len(source_frames) < 2:
-                logger.warning("Insufficient frames after duration filter")
-                return None
+                return _completed(None)
 
             # Calculate capture FPS and slow-mo factor
-            time_span = source_frames[-1][0] - source_frames[0][0]
-            capture_fps = (len(source_frames) - 1) / time_span if time_span > 0 else 30.0
+            time_span = float(timestamps[-1] - timestamps[0])
+            capture_fps = (frame_count - 1) / time_span if time_span > 0 else 30.0
             slowmo_factor = capture_fps / playback_fps
 
-            # Generate filename
-            if filename is None:
-                timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"slowmo_{int(capture_fps)}fps_{slowmo_factor:.1f}x_{timestamp_str}.mp4"
-
-            output_path = self.output_dir / filename
+        # Generate filename (outside lock)
+        if filename is None:
+            filename = _slowmo_filename(capture_fps, slowmo_factor)
+        output_path = self.output_dir / filename
 
         # Write video (outside lock)
         try:
-            success = self._write_slowmo_video(source_frames, output_path, playback_fps)
-            if success:
+            written = self._write_slowmo_video(
+                fill, (frame_count, *frame_shape), dtype, yuv420p, output_path, playback_fps
+            )
+        except Exception as e:
+            logger.error(f"Failed to save slow-mo clip: {e}")
+            return _completed(None)
+
+        result: Future[Optional[str]] = Future()
+
+        def finish(done: Future) -> None:
+            try:
+                frames_written = done.result()
+            except Exception as e:
+                logger.error(f"Failed to save slow-mo clip: {e}")
+                result.set_result(None)
+                return
+            if frames_written:
                 logger.info(
                     f"Saved slow-mo clip: {output_path} "
-                    f"({len(source_frames)} frames @ {capture_fps:.1f}fps capture, "
+                    f"({frames_written} frames @ {capture_fps:.1f}fps capture, "
                     f"{playback_fps}fps playback = {slowmo_factor:.1f}x slow-mo)"
                 )
-                return str(output_path)
-            return None
+                result.set_result(str(output_path))
+            else:
+                result.set_result(None)
 
-        except Exception as e:
-            logger.error(f"Failed to save slow-mo clip: {e}")
-            return None
+        written.add_done_callback(finish)
+        return result
 
     def _write_slowmo_video(
         self,
-        frames_with_timestamps: list[tuple[float, np.ndarray]],
+        fill: Callable[[np.ndarray], int],
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+        yuv420p: bool,
         output_path: Path,
         playback_fps: float,
-    ) -> bool:
+    ) -> "Future[int]":
         """
         Write frames to slow-motion video file.
 
+        Frames are copied by ``fill`` into one staging array, backed by
+        SharedMemory when the process pool encodes them. Without a pool, when the
+        clip would not fit in the free /dev/shm space, or if the pool breaks,
+        they are encoded in this thread instead.
+
         Args:
-            frames_with_timestamps: List of (timestamp, frame) tuples
+            fill: Copies the frames into the (N, H, W[, C]) array it is given and
+                returns how many leading frames are invalid and must be skipped
+            shape: Staging array shape (N, H, W[, C])
+            dtype: Frame dtype
+            yuv420p: Frames are color stored as planar I420
             output_path: Output file path
             playback_fps: Playback frame rate (determines slow-mo factor)
 
         Returns:
-            True if successful
+            Future resolving to the number of frames written (0 on failure)
         """
-        if not frames_with_timestamps:
-            return False
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        pool = None
+        if self._encode_workers > 0:
+            free = _shm_free_bytes()
+            if free is not None and nbytes > free:
+                logger.info(
+                    f"Clip ({nbytes / 1e6:.0f} MB) exceeds free shared memory "
+                    f"({free / 1e6:.0f} MB), encoding in-process"
+                )
+            else:
+                pool = self._get_encode_pool()
+
+        if pool is None:
+            staged = np.empty(shape, dtype=dtype)
+            start = fill(staged)
+            frames = staged[start:]
+            ok = len(frames) > 0 and _encode_frames(
+                frames, output_path, playback_fps, self.codec, yuv420p
+            )
+            return _completed(len(frames) if ok else 0)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        staged = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+        def release() -> None:
+            nonlocal staged
+            staged = None  # Drop the buffer export so the block can be closed
+            shm.close()
+            shm.unlink()
+
+        def encode_here() -> int:
+            ok = _encode_frames(staged[start:], output_path, playback_fps, self.codec, yuv420p)
+            return frame_count if ok else 0
 
-        # Get frame dimensions
-        first_frame = frames_with_timestamps[0][1]
-        height, width = first_frame.shape[:2]
-        is_color = len(first_frame.shape) == 3 and first_frame.shape[2] == 3
+        try:
+            start = fill(staged)
+            frame_count = shape[0] - start
+            if frame_count <= 0:
+                release()
+                return _completed(0)
+            future = pool.submit(
+                _encode_worker,
+                shm.name,
+                shape,
+                start,
+                dtype.str,
+                str(output_path),
+                playback_fps,
+                self.codec,
+                yuv420p,
+            )
+        except BrokenProcessPool as e:
+            self._drop_encode_pool(e)
+            try:
+                return _completed(encode_here())
+            finally:
+                release()
+        except BaseException:
+            release()
+            raise
+
+        result: Future[int] = Future()
+
+        def finish(done: Future) -> None:
+            # Runs in the pool's management thread once the worker is done
+            try:
+                try:
+                    result.set_result(frame_count if done.result() else 0)
+                except BrokenProcessPool as e:
+                    self._drop_encode_pool(e)
+                    result.set_result(encode_here())
+                except Exception as e:
+                    result.set_exception(e)
+            finally:
+                release()
+
+        future.add_done_callback(finish)
+        return result
+
+    def _drop_encode_pool(self, error: BaseException) -> None:
+        """Switch to in-process encoding after the pool broke."""
+        logger.warning(f"Encode pool failed, encoding in-process from now on: {error}")
+        with self._lock:
+            self._encode_workers = 0
+            self._encode_pool = None
 
-        # Use H.264 codec for better compatibility
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore[attr-defined]
-        writer = cv2.VideoWriter(
-            str(output_path), fourcc, playback_fps, (width, height), isColor=is_color
-        )
+    def _get_encode_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the encode process pool, starting it on first use.
 
-        if not writer.isOpened():
-            logger.error(f"Failed to open video writer for {output_path}")
-            return False
+        Uses the spawn start method: forking would copy the capture threads'
+        locks and the camera SDK state into the workers.
 
-        try:
-            for _, frame in frames_with_timestamps:
-                if is_color:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                else:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                writer.write(frame_bgr)
+        Returns:
+            ProcessPoolExecutor, or None when encoding in-process
+        """
+        with self._lock:
+            if self._encode_pool is None and self._encode_workers > 0:
+                self._encode_pool = ProcessPoolExecutor(
+                    max_workers=self._encode_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._encode_pool
 
-            return True
+    def _snapshot_ring(self, duration_sec: Optional[float] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Copy the ring out in capture order.
 
-        finally:
-            writer.release()
+        The ring is overwritten in place while a clip is written, so frames are
+        gathered with one np.take copy.
+
+        Args:
+            duration_sec: Only copy the newest duration_sec of frames (None = all)
+
+        Returns:
+            (timestamps, frames) arrays, oldest first
+        """
+        ring = self._ring
+        if ring is None:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.uint8)
+        return ring.snapshot(duration_sec)
 
     def clear_buffer(self) -> None:
         """Clear frame buffer and recording buffer."""
         with self._lock:
-            self._buffer.clear()
-            self._recording_frames = []
-            self._fps_window.clear()
+            ring = self._ring
+            if ring is not None:
+                # Logical clear; the newest frame stays available for preview
+                ring.start = ring.written
+            self._recording = ([], array("d"))
+            self._fps_start = self._fps_written
             logger.debug("Buffers cleared")
@@ -4,12 +4,24 @@ Provides `initialize_camera()` which supports selecting a camera by IP address
 (or by environment variable `CAMERA_IP`) to accommodate dynamic link-local IPs.
 
 This module wraps `CameraDevice` and `WebcamDevice` enumeration and initialization.
+
+Opt-in camera pool: when `CAMERA_POOL_IDLE_SEC` is set to a positive number of
+seconds, devices handed back through `release_camera()` are parked in a small
+process-wide pool and reused by the next `initialize_camera()` for the same
+device, so a viewer reconnecting shortly after leaving skips both enumeration
+and the full SDK open. A pooled device stays open - MindVision streams are
+paused, but the device lock is held and other apps cannot open the camera -
+until it is reused, idle for that long, or the process exits. Unset or 0 (the
+default) closes cameras immediately (FR-005).
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import threading
+import time
 from typing import Optional, Tuple, Union
 
 from src.camera.device import CameraDevice, CameraError, CameraInfo
@@ -17,6 +29,168 @@ from src.camera.webcam import WebcamDevice
 
 logger = logging.getLogger(__name__)
 
+# Seconds a released camera stays open waiting to be reused; 0 disables the pool
+POOL_IDLE_ENV = "CAMERA_POOL_IDLE_SEC"
+
+_pool_lock = threading.Lock()
+# (source_type, device_index) -> (release time, opened device)
+_POOL: dict[tuple[str, int], tuple[float, Union[CameraDevice, WebcamDevice]]] = {}
+# Single timer closing the next pooled device to go idle (guarded by _pool_lock)
+_evict_timer: Optional[threading.Timer] = None
+
+
+def _pool_idle_timeout() -> float:
+    """Read CAMERA_POOL_IDLE_SEC; invalid or negative values disable the pool."""
+    raw = os.environ.get(POOL_IDLE_ENV, "")
+    if not raw:
+        return 0.0
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; camera pool disabled", POOL_IDLE_ENV, raw)
+        return 0.0
+
+
+def _pool_key(info: CameraInfo) -> tuple[str, int]:
+    return (info.source_type, info.device_index)
+
+
+def _close_quietly(camera: Union[CameraDevice, WebcamDevice]) -> None:
+    try:
+        camera.__exit__(None, None, None)
+    except Exception as e:
+        logger.error("Error closing pooled camera: %s", e)
+
+
+def _reschedule_eviction_locked(timeout: float) -> None:
+    """Point the eviction timer at the oldest pooled entry (caller holds _pool_lock)."""
+    global _evict_timer
+    if _evict_timer is not None:
+        _evict_timer.cancel()
+        _evict_timer = None
+    if not _POOL:
+        return
+
+    oldest = min(ts for ts, _ in _POOL.values())
+    delay = max(oldest + timeout - time.monotonic(), 0.0)
+    _evict_timer = threading.Timer(delay, _evict_idle)
+    _evict_timer.daemon = True
+    _evict_timer.start()
+
+
+def _take_pooled(info: CameraInfo) -> Optional[Union[CameraDevice, WebcamDevice]]:
+    """Pop a still-open pooled device for `info`, closing it instead if it went stale."""
+    timeout = _pool_idle_timeout()
+    with _pool_lock:
+        entry = _POOL.pop(_pool_key(info), None)
+        if entry is not None:
+            _reschedule_eviction_locked(timeout)
+    if entry is None:
+        return None
+
+    released_at, camera = entry
+    if time.monotonic() - released_at >= timeout or not camera.is_initialized:
+        _close_quietly(camera)
+        return None
+
+    if isinstance(camera, CameraDevice):
+        try:
+            camera.resume_streaming()
+        except Exception as e:
+            logger.warning("Failed to resume pooled camera, reopening: %s", e)
+            _close_quietly(camera)
+            return None
+    return camera
+
+
+def _take_any_pooled(
+    preferred_ip: Optional[str],
+) -> Optional[Union[CameraDevice, WebcamDevice]]:
+    """Reuse a pooled device for auto-detection without enumerating, if one fits."""
+    with _pool_lock:
+        infos = [camera.camera_info for _, camera in _POOL.values()]
+    if not infos:
+        return None
+
+    # Same preference order as enumerate_all_cameras(): MindVision first
+    infos.sort(key=lambda c: (c.source_type != "mindvision", c.device_index))
+    if preferred_ip:
+        infos = [c for c in infos if _matches_ip(c, preferred_ip)]
+        if not infos:
+            return None
+    return _take_pooled(infos[0])
+
+
+def _matches_ip(info: CameraInfo, ip: str) -> bool:
+    """Best-effort match of a MindVision camera against an IP address."""
+    return info.source_type == "mindvision" and (
+        ip in (info.friendly_name or "") or ip in (info.port_type or "")
+    )
+
+
+def _evict_idle() -> None:
+    """Close pooled devices idle for at least CAMERA_POOL_IDLE_SEC, then re-arm the timer."""
+    timeout = _pool_idle_timeout()
+    now = time.monotonic()
+    with _pool_lock:
+        stale = [k for k, (ts, _) in _POOL.items() if now - ts >= timeout]
+        cameras = [_POOL.pop(k)[1] for k in stale]
+        _reschedule_eviction_locked(timeout)
+    for camera in cameras:
+        logger.info("Closing idle pooled camera: %s", camera.camera_info.friendly_name)
+        _close_quietly(camera)
+
+
+def release_camera(camera: Union[CameraDevice, WebcamDevice]) -> None:
+    """
+    Hand back a camera from `initialize_camera()`.
+
+    Closes it immediately unless the pool is enabled with CAMERA_POOL_IDLE_SEC.
+    Otherwise the device stays open (MindVision streams paused, device lock
+    still held) for up to that many seconds; a matching `initialize_camera()`
+    call in that window gets it back without re-enumerating or reopening.
+
+    Args:
+        camera: Device previously returned by `initialize_camera()`
+    """
+    timeout = _pool_idle_timeout()
+    if timeout <= 0 or not camera.is_initialized:
+        _close_quietly(camera)
+        return
+
+    if isinstance(camera, CameraDevice):
+        try:
+            camera.pause_streaming()
+        except Exception as e:
+            logger.warning("Failed to pause camera, closing instead of pooling: %s", e)
+            _close_quietly(camera)
+            return
+
+    key = _pool_key(camera.camera_info)
+    with _pool_lock:
+        previous = _POOL.pop(key, None)
+        _POOL[key] = (time.monotonic(), camera)
+        _reschedule_eviction_locked(timeout)
+    if previous is not None and previous[1] is not camera:
+        _close_quietly(previous[1])
+    logger.info(
+        "Camera %s kept open for reuse for %.0fs", camera.camera_info.friendly_name, timeout
+    )
+
+
+@atexit.register
+def close_pooled_cameras() -> None:
+    """Close every pooled camera (registered with atexit)."""
+    global _evict_timer
+    with _pool_lock:
+        cameras = [camera for _, camera in _POOL.values()]
+        _POOL.clear()
+        if _evict_timer is not None:
+            _evict_timer.cancel()
+            _evict_timer = None
+    for camera in cameras:
+        _close_quietly(camera)
+
 
 def enumerate_all_cameras() -> list[CameraInfo]:
     """
@@ -61,26 +235,25 @@ def initialize_camera(
     if selected_info:
         selected = selected_info
     else:
-        # Fallback to auto-detection logic
-        all_cameras = enumerate_all_cameras()
-        if not all_cameras:
-            return None, "No camera detected. Please connect a camera and restart."
-
         # Allow env var to override preferred IP
         env_ip = os.environ.get("CAMERA_IP")
         if preferred_ip is None and env_ip:
             preferred_ip = env_ip
 
+        pooled = _take_any_pooled(preferred_ip)
+        if pooled is not None:
+            logger.info("Reusing open camera: %s", pooled.camera_info.friendly_name)
+            return pooled, None
+
+        # Fallback to auto-detection logic
+        all_cameras = enumerate_all_cameras()
+        if not all_cameras:
+            return None, "No camera detected. Please connect a camera and restart."
+
         selected = None
         if preferred_ip:
             # Try best-effort match for MindVision cameras
-            for c in all_cameras:
-                if c.source_type == "mindvision":
-                    if preferred_ip in (c.friendly_name or "") or preferred_ip in (
-                        c.port_type or ""
-                    ):
-                        selected = c
-                        break
+            selected = next((c for c in all_cameras if _matches_ip(c, preferred_ip)), None)
 
             if selected is None:
                 logger.warning(
@@ -91,6 +264,11 @@ def initialize_camera(
         else:
             selected = all_cameras[0]
 
+    pooled = _take_pooled(selected)
+    if pooled is not None:
+        logger.info("Reusing open camera: %s", selected.friendly_name)
+        return pooled, None
+
     # Create appropriate device instance
     if selected.source_type == "webcam":
         camera = WebcamDevice(selected)
@@ -6,18 +6,23 @@ the last N seconds as a video clip on demand.
 """
 
 import logging
+import os
 import threading
 import time
 from collections import deque
-from datetime import datetime
+from itertools import takewhile
 from pathlib import Path
 from typing import Optional
 
-import cv2
 import numpy as np
 
+from src.camera.video_writer import open_video_writer, uniform_frame_indices, write_frames
+
 logger = logging.getLogger(__name__)
 
+# Minimum time between clip directory sweeps
+CLEANUP_INTERVAL_SEC = 60.0
+
 
 class VideoRecorder:
     """
@@ -44,6 +49,7 @@ class VideoRecorder:
         max_duration_sec: float = 5.0,
         output_dir: str = "./clips",
         cleanup_age_hours: int = 1,
+        target_fps: Optional[float] = None,
     ):
         """
         Initialize video recorder.
@@ -52,14 +58,23 @@ class VideoRecorder:
             max_duration_sec: Maximum buffer duration in seconds
             output_dir: Directory for saving video clips
             cleanup_age_hours: Auto-delete clips older than this many hours
+            target_fps: Optional frame rate to cap the buffer at (max_duration_sec ×
+                target_fps frames, plus headroom) as a memory bound. Frames older
+                than max_duration_sec are dropped regardless, so a rate above
+                target_fps shortens the buffer; None = bound by time only.
         """
         self.max_duration_sec = max_duration_sec
         self.output_dir = Path(output_dir)
         self.cleanup_age_hours = cleanup_age_hours
 
-        # Frame buffer: [(timestamp, frame), ...]
-        self._buffer: deque = deque()
+        # Frame buffer: [(timestamp, frame), ...], pruned to max_duration_sec on
+        # append; the optional frame cap evicts the oldest frame in O(1)
+        max_frames = None
+        if target_fps is not None:
+            max_frames = max(1, int(max_duration_sec * target_fps * 1.2))  # 20% headroom
+        self._buffer: deque = deque(maxlen=max_frames)
         self._lock = threading.RLock()
+        self._last_cleanup = float("-inf")  # time.monotonic() of the last sweep
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -68,21 +83,28 @@ class VideoRecorder:
             f"VideoRecorder initialized: max_duration={max_duration_sec}s, output_dir={output_dir}"
         )
 
-    def add_frame(self, frame: np.ndarray) -> None:
+    def add_frame(self, frame: np.ndarray, copy: bool = True) -> None:
         """
         Add frame to circular buffer with timestamp.
 
         Args:
             frame: Frame data (H×W×C RGB or H×W mono)
+            copy: Store a copy of the frame. Pass False to hand over a freshly
+                allocated frame without copying it; the caller must not modify or
+                reuse it afterwards. Frames from CameraDevice are views over a
+                reused SDK buffer and must be copied.
         """
+        if copy:
+            frame = frame.copy()
         with self._lock:
             current_time = time.time()
-            self._buffer.append((current_time, frame.copy()))
+            buffer = self._buffer
+            buffer.append((current_time, frame))
 
             # Prune old frames beyond max duration
             cutoff_time = current_time - self.max_duration_sec
-            while self._buffer and self._buffer[0][0] < cutoff_time:
-                self._buffer.popleft()
+            while buffer[0][0] < cutoff_time:
+                buffer.popleft()
 
     def get_buffer_duration(self) -> float:
         """
@@ -136,8 +158,13 @@ class VideoRecorder:
             current_time = time.time()
             cutoff_time = current_time - duration_sec
 
-            # Extract frames within time range
-            frames_to_save = [(ts, frame) for ts, frame in self._buffer if ts >= cutoff_time]
+            # Extract frames within time range: timestamps are appended in order, so
+            # walk back from the newest frame and stop at the cutoff; only the
+            # selected tail is visited, not the whole buffer
+            frames_to_save = list(
+                takewhile(lambda entry: entry[0] >= cutoff_time, reversed(self._buffer))
+            )
+            frames_to_save.reverse()
 
             if len(frames_to_save) < 2:
                 logger.warning(f"Only {len(frames_to_save)} frames in requested duration")
@@ -145,8 +172,7 @@ class VideoRecorder:
 
             # Generate output filename
             if filename is None:
-                timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"clip_{timestamp_str}.mp4"
+                filename = time.strftime("clip_%Y%m%d_%H%M%S.mp4")
 
             output_path = self.output_dir / filename
 
@@ -188,9 +214,9 @@ class VideoRecorder:
             return False
 
         # Calculate actual FPS from timestamps
-        timestamps = [ts for ts, _ in frames_with_timestamps]
+        timestamps = np.array([ts for ts, _ in frames_with_timestamps], dtype=np.float64)
         if len(timestamps) > 1:
-            time_span = timestamps[-1] - timestamps[0]
+            time_span = float(timestamps[-1] - timestamps[0])
             fps = (len(timestamps) - 1) / time_span if time_span > 0 else 10.0
         else:
             fps = 10.0  # Fallback
@@ -198,6 +224,10 @@ class VideoRecorder:
         # Limit FPS to reasonable range
         fps = max(1.0, min(fps, 60.0))
 
+        # Place frames by capture time so jitter (and capture above the output
+        # rate) doesn't change playback speed
+        indices = uniform_frame_indices(timestamps, fps)
+
         # Get frame dimensions from first frame
         first_frame = frames_with_timestamps[0][1]
         height, width = first_frame.shape[:2]
@@ -205,27 +235,23 @@ class VideoRecorder:
         # Convert RGB to BGR for OpenCV
         is_color = len(first_frame.shape) == 3 and first_frame.shape[2] == 3
 
-        # Initialize video writer
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore
-        writer = cv2.VideoWriter(str(output_path), fourcc, fps, (width, height), isColor=is_color)
+        # Initialize video writer (NVENC H.264 when available, OpenCV mp4v otherwise)
+        opened = open_video_writer(output_path, fps, (width, height), is_color)
 
-        if not writer.isOpened():
+        if opened is None:
             logger.error(f"Failed to open video writer for {output_path}")
             return False
+        writer, pix_fmt = opened
 
         try:
-            # Write all frames
-            for _, frame in frames_with_timestamps:
-                if is_color:
-                    # Convert RGB to BGR for OpenCV
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                    writer.write(frame_bgr)
-                else:
-                    # Mono frame: convert to 3-channel BGR
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                    writer.write(frame_bgr)
-
-            logger.debug(f"Wrote {len(frames_with_timestamps)} frames at {fps:.1f} FPS")
+            # Write retimed frames (converted to the writer's input layout)
+            written = write_frames(
+                writer, pix_fmt, (frames_with_timestamps[i][1] for i in indices), is_color
+            )
+
+            logger.debug(
+                f"Wrote {written} frames at {fps:.1f} FPS ({len(frames_with_timestamps)} captured)"
+            )
             return True
 
         finally:
@@ -234,14 +260,28 @@ class VideoRecorder:
     def _cleanup_old_clips(self) -> None:
         """
         Delete video clips older than cleanup_age_hours.
+
+        Sweeps at most once per CLEANUP_INTERVAL_SEC, using os.scandir so the
+        directory listing supplies each entry's stat data.
         """
+        now = time.monotonic()
+        if now - self._last_cleanup < CLEANUP_INTERVAL_SEC:
+            return
+        self._last_cleanup = now
+
         try:
             cutoff_time = time.time() - (self.cleanup_age_hours * 3600)
 
-            for clip_file in self.output_dir.glob("clip_*.mp4"):
-                if clip_file.stat().st_mtime < cutoff_time:
-                    clip_file.unlink()
-                    logger.debug(f"Deleted old clip: {clip_file}")
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.startswith("clip_")
+                        and name.endswith(".mp4")
+                        and entry.stat().st_mtime < cutoff_time
+                    ):
+                        os.unlink(entry.path)
+                        logger.debug(f"Deleted old clip: {entry.path}")
 
         except Exception as e:
             logger.warning(f"Cleanup failed: {e}")
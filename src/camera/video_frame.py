@@ -4,23 +4,46 @@ Maps to FR-002, FR-006, FR-007, FR-009, FR-010
 Reference: specs/001-using-gradio-as/contracts/video_frame.py
 """
 
-from dataclasses import dataclass
+from typing import NamedTuple, Optional
 
+import cv2
 import numpy as np
 
+# dtype.num of uint8; an int compare is cheaper than dtype object equality
+_UINT8_NUM = np.dtype(np.uint8).num
 
-@dataclass(frozen=True)
-class VideoFrame:
+# Expected data.ndim for color (H×W×3) and mono (H×W) frames
+_COLOR_NDIM = 3
+_MONO_NDIM = 2
+
+
+def to_rgb(frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
-    Immutable video frame data.
+    Convert a BGR (H×W×3) or mono (H×W) frame to contiguous RGB (H×W×3).
+
+    Uses OpenCV's vectorized cvtColor instead of a ``[..., ::-1]`` slice, which
+    yields a negative-stride view that consumers needing contiguous RGB have
+    to copy again.
+
+    Args:
+        frame: uint8 BGR or grayscale frame
+        out: Optional pre-allocated (H×W×3) uint8 buffer, reused when the shape matches
+
+    Returns:
+        np.ndarray: RGB frame (``out`` itself when it was usable)
 
     Contract:
-        - Immutable (frozen=True) - safe for multi-threaded access
-        - All fields required at construction
-        - Frame data is read-only after creation
+        - Callers converting every frame SHOULD pass a reused ``out`` buffer
+        - Mono frames are expanded with COLOR_GRAY2RGB
     """
+    code = cv2.COLOR_GRAY2RGB if frame.ndim == 2 else cv2.COLOR_BGR2RGB
+    if out is not None and out.shape == (*frame.shape[:2], 3) and out.dtype == frame.dtype:
+        return cv2.cvtColor(frame, code, dst=out)
+    return cv2.cvtColor(frame, code)
+
 
-    data: np.ndarray  # Pixel data (H×W×C or H×W)
+class _VideoFrameFields(NamedTuple):
+    data: np.ndarray  # Pixel data (H×W×C or H×W); may alias the SDK buffer, treat as read-only
     width: int  # Frame width in pixels
     height: int  # Frame height in pixels
     channels: int  # 1 for mono, 3 for color
@@ -28,7 +51,67 @@ class VideoFrame:
     sequence_number: int  # Monotonic frame counter
     media_type: int  # SDK media type constant
 
-    def __post_init__(self):
+
+class VideoFrame(_VideoFrameFields):
+    """
+    Immutable video frame data.
+
+    Backed by a NamedTuple: field storage and attribute access are C-level
+    tuple slots, and trusted producers can build one with a single
+    tuple.__new__ call via from_trusted().
+
+    Contract:
+        - Immutable (tuple) - safe for multi-threaded access
+        - All fields required at construction
+        - Frame data is read-only after creation
+        - Validated on construction; under ``python -O`` only the channel
+          count is checked
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        data: np.ndarray,
+        width: int,
+        height: int,
+        channels: int,
+        timestamp: float,
+        sequence_number: int,
+        media_type: int,
+    ) -> "VideoFrame":
+        frame = tuple.__new__(
+            cls, (data, width, height, channels, timestamp, sequence_number, media_type)
+        )
+        if __debug__:
+            frame._validate()
+        elif channels not in (1, 3):
+            # python -O drops full validation; keep the cheap channel check
+            raise ValueError(f"Invalid channel count: {channels}")
+        return frame
+
+    @classmethod
+    def from_trusted(
+        cls,
+        data: np.ndarray,
+        width: int,
+        height: int,
+        channels: int,
+        timestamp: float,
+        sequence_number: int,
+        media_type: int,
+    ) -> "VideoFrame":
+        """
+        Build a frame without validation, for producers that already guarantee it.
+
+        The capture path knows shape and dtype from the SDK frame head, so it
+        can skip _validate(). External callers should use the normal constructor.
+        """
+        return tuple.__new__(
+            cls, (data, width, height, channels, timestamp, sequence_number, media_type)
+        )
+
+    def _validate(self) -> None:
         """
         Validate frame integrity.
 
@@ -44,6 +127,29 @@ class VideoFrame:
         Raises:
             ValueError: Validation failed
         """
+        # Fast path: a single combined check for the common, valid frame.
+        # Compare ndim and per-axis ints instead of building an expected shape tuple.
+        data = self.data
+        height, width, channels = self.height, self.width, self.channels
+        shape = data.shape
+        ndim = _COLOR_NDIM if channels == 3 else _MONO_NDIM
+        if (
+            data.ndim == ndim
+            and shape[0] == height
+            and shape[1] == width
+            and (ndim == _MONO_NDIM or shape[2] == 3)
+            and data.dtype.num == _UINT8_NUM
+            and channels in (1, 3)
+            and width > 0
+            and height > 0
+            and self.timestamp > 0
+            and self.sequence_number >= 0
+        ):
+            return
+        self._raise_invalid()
+
+    def _raise_invalid(self) -> None:
+        """Report which check failed (slow path, only reached for invalid frames)."""
         # Validate channels first
         if self.channels not in [1, 3]:
             raise ValueError(f"Invalid channel count: {self.channels}")
@@ -94,9 +200,34 @@ class VideoFrame:
         Contract:
             - Color frames: Convert BGR to RGB (H×W×3)
             - Mono frames: Return (H×W) grayscale
-            - Minimal copy overhead
+            - No data copy: returns a read-only view sharing the frame buffer
         """
         if self.is_color:
             # Convert BGR to RGB (camera outputs BGR, Gradio expects RGB)
-            return self.data[..., ::-1]
-        return self.data
+            view = self.data[..., ::-1]
+        else:
+            view = self.data.view()
+        view.flags.writeable = False
+        return view
+
+    def to_gradio_into(self, out: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Convert frame to contiguous Gradio format in a caller-owned buffer.
+
+        For consumers that need packed RGB (JPEG/PNG encoding, tensors), where the
+        negative-stride view from to_gradio_format() would be copied again.
+
+        Args:
+            out: Reused (H×W×3) uint8 buffer owned by the caller (ignored for mono)
+
+        Returns:
+            np.ndarray: ``out`` holding RGB for color frames (a new array when
+            ``out`` is None or doesn't match); read-only (H×W) view for mono
+
+        Contract:
+            - Color frames: BGR to RGB in one cvtColor pass into ``out``
+            - Mono frames: Same as to_gradio_format(), ``out`` untouched
+        """
+        if not self.is_color:
+            return self.to_gradio_format()
+        return to_rgb(self.data, out)
@@ -0,0 +1,252 @@
+"""
+Video writer backends shared by the clip recorders.
+
+Prefers GPU (NVENC) H.264 encoding through the optional ``ffmpegcv`` package,
+then (on ARM Linux boards such as the Raspberry Pi) the V4L2 M2M / OMX hardware
+H.264 encoders through OpenCV's FFmpeg backend, and falls back to OpenCV's CPU
+``mp4v`` writer. All backends expose the same
+``write(frame)`` / ``isOpened()`` / ``release()`` interface but take different
+input layouts: the NVENC pipe is fed planar YUV420P (what the encoder consumes,
+1.5 bytes/pixel), OpenCV needs BGR24 (or GRAY8 when opened for mono).
+write_frames() converts accordingly.
+"""
+
+import logging
+import os
+import platform
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import cv2
+import numpy as np
+
+try:
+    import ffmpegcv
+except ImportError:  # Optional: install the "nvenc" extra
+    ffmpegcv = None
+
+logger = logging.getLogger(__name__)
+
+# Input pixel formats returned by open_video_writer()
+PIX_FMT_BGR24 = "bgr24"
+PIX_FMT_YUV420P = "yuv420p"
+
+# Codec choices for open_video_writer()
+VIDEO_CODECS = ("auto", "nvenc", "v4l2m2m", "omx", "mp4v")
+
+# Hardware H.264 encoders selected through OpenCV's FFmpeg writer options
+_FFMPEG_HW_ENCODERS = {"v4l2m2m": "h264_v4l2m2m", "omx": "h264_omx"}
+_WRITER_OPTIONS_ENV = "OPENCV_FFMPEG_WRITER_OPTIONS"
+_IS_ARM_LINUX = platform.system() == "Linux" and platform.machine() in ("aarch64", "armv7l")
+_AUTO_CODECS = ("nvenc", "v4l2m2m", "omx", "mp4v") if _IS_ARM_LINUX else ("nvenc", "mp4v")
+
+# OpenCV reads the writer options from the environment at open time
+_env_lock = threading.Lock()
+
+# Upper bound on the RGB->BGR conversion tile for stacked frame arrays
+_CONVERT_TILE_BYTES = 16 * 1024 * 1024
+
+
+def open_video_writer(
+    output_path: Path,
+    fps: float,
+    size: tuple[int, int],
+    is_color: bool,
+    codec: str = "auto",
+) -> Optional[tuple[Any, str]]:
+    """
+    Open a video writer with the fastest available H.264 encoder.
+
+    "auto" tries NVENC, then (on ARM Linux) h264_v4l2m2m and h264_omx, then
+    mp4v. A specific codec falls back to mp4v only. If the user has set
+    OPENCV_FFMPEG_WRITER_OPTIONS themselves, the hardware encoders are not
+    probed and the variable applies to the OpenCV writer as-is.
+
+    Args:
+        output_path: Output .mp4 path
+        fps: Playback frame rate
+        size: Frame size as (width, height)
+        is_color: Source frames are color (passed to the OpenCV writers)
+        codec: One of VIDEO_CODECS
+
+    Returns:
+        (writer, pix_fmt) where pix_fmt is the input layout the writer expects
+        (PIX_FMT_YUV420P or PIX_FMT_BGR24), or None if no backend could open the file
+
+    Raises:
+        ValueError: If codec is not one of VIDEO_CODECS
+    """
+    if codec not in VIDEO_CODECS:
+        raise ValueError(f"Unknown codec {codec!r}, expected one of {VIDEO_CODECS}")
+
+    candidates = _AUTO_CODECS if codec == "auto" else (codec, "mp4v")
+    for name in dict.fromkeys(candidates):
+        if name == "nvenc":
+            opened = _open_nvenc(output_path, fps, size)
+        elif name in _FFMPEG_HW_ENCODERS:
+            if _WRITER_OPTIONS_ENV in os.environ:
+                continue
+            opened = _open_opencv(output_path, fps, size, is_color, _FFMPEG_HW_ENCODERS[name])
+        else:
+            opened = _open_opencv(output_path, fps, size, is_color)
+        if opened is not None:
+            return opened
+    return None
+
+
+def _open_nvenc(output_path: Path, fps: float, size: tuple[int, int]) -> Optional[tuple[Any, str]]:
+    """Open an ffmpegcv NVENC writer fed YUV420P, or None if unavailable."""
+    width, height = size
+    # YUV420P subsamples chroma 2x2, so the pipe needs even dimensions
+    if ffmpegcv is None or width % 2 or height % 2:
+        return None
+    try:
+        # Raises when ffmpeg has no NVENC encoder / no NVIDIA GPU is present
+        writer = ffmpegcv.VideoWriterNV(str(output_path), "h264", fps, pix_fmt=PIX_FMT_YUV420P)
+        return writer, PIX_FMT_YUV420P
+    except Exception as e:
+        logger.debug("NVENC writer unavailable: %s", e)
+        return None
+
+
+def _open_opencv(
+    output_path: Path,
+    fps: float,
+    size: tuple[int, int],
+    is_color: bool,
+    ffmpeg_encoder: Optional[str] = None,
+) -> Optional[tuple[Any, str]]:
+    """
+    Open an OpenCV writer, or None if it fails to open.
+
+    Args:
+        ffmpeg_encoder: FFmpeg encoder to force via OPENCV_FFMPEG_WRITER_OPTIONS
+            (None = the mp4v software encoder)
+    """
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")  # type: ignore[attr-defined]
+    if ffmpeg_encoder is None:
+        writer = cv2.VideoWriter(str(output_path), fourcc, fps, size, isColor=is_color)
+    else:
+        with _env_lock:
+            os.environ[_WRITER_OPTIONS_ENV] = f"video_codec;{ffmpeg_encoder}"
+            try:
+                writer = cv2.VideoWriter(str(output_path), fourcc, fps, size, isColor=is_color)
+            finally:
+                del os.environ[_WRITER_OPTIONS_ENV]
+    if not writer.isOpened():
+        if ffmpeg_encoder is not None:
+            logger.debug("%s writer unavailable", ffmpeg_encoder)
+        return None
+    return writer, PIX_FMT_BGR24
+
+
+def write_frames(
+    writer: Any,
+    pix_fmt: str,
+    frames: Iterable[np.ndarray],
+    is_color: bool,
+    yuv420p_input: bool = False,
+) -> int:
+    """
+    Convert frames to the writer's input layout and write them.
+
+    One conversion buffer is reused for every frame (cvtColor writes into dst).
+    A contiguous (N, H, W, 3) array going to a BGR24 writer is converted in
+    tiles of several frames per cvtColor call.
+
+    Args:
+        writer: Writer from open_video_writer()
+        pix_fmt: Input layout returned alongside the writer
+        frames: RGB (H×W×3) or mono (H×W) uint8 frames, all the same shape
+            (any iterable, or a stacked array)
+        is_color: Frames are RGB (False = mono)
+        yuv420p_input: Color frames are already planar I420 ((H·3/2)×W) rather than RGB
+
+    Returns:
+        Number of frames written
+    """
+    count = 0
+    buf = None
+    if is_color and yuv420p_input:
+        for frame in frames:
+            if pix_fmt == PIX_FMT_YUV420P:
+                # Already in the encoder's layout
+                writer.write(frame)
+            else:
+                buf = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_I420, dst=buf)
+                writer.write(buf)
+            count += 1
+    elif pix_fmt == PIX_FMT_YUV420P:
+        for frame in frames:
+            if is_color:
+                buf = cv2.cvtColor(frame, cv2.COLOR_RGB2YUV_I420, dst=buf)
+            else:
+                if buf is None:
+                    # I420 layout: H rows of Y, then H/2 rows of packed U and V.
+                    # Mono chroma is neutral, so fill it once and only copy Y.
+                    height = frame.shape[0]
+                    buf = np.full((height * 3 // 2, frame.shape[1]), 128, dtype=np.uint8)
+                np.copyto(buf[: frame.shape[0]], frame)
+            writer.write(buf)
+            count += 1
+    elif is_color and isinstance(frames, np.ndarray) and frames.flags.c_contiguous:
+        count = _write_bgr_tiled(writer, frames)
+    else:
+        for frame in frames:
+            if is_color:
+                # Convert RGB to BGR for OpenCV
+                buf = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=buf)
+                writer.write(buf)
+            else:
+                # Mono writer (isColor=False) takes single-channel frames as-is
+                writer.write(frame)
+            count += 1
+    return count
+
+
+def _write_bgr_tiled(writer: Any, frames: np.ndarray) -> int:
+    """
+    Write a stacked (N, H, W, 3) RGB array to a BGR writer, converting in tiles.
+
+    A C-contiguous tile of frames is one tall (n·H, W, 3) image, so a single
+    cvtColor call converts several frames.
+
+    Returns:
+        Number of frames written
+    """
+    n, height, width = frames.shape[:3]
+    tile = max(1, min(n, _CONVERT_TILE_BYTES // max(1, frames[0].nbytes)))
+    buf = np.empty((tile, height, width, 3), dtype=frames.dtype)
+    for start in range(0, n, tile):
+        chunk = frames[start : start + tile]
+        out = buf[: len(chunk)]
+        cv2.cvtColor(chunk.reshape(-1, width, 3), cv2.COLOR_RGB2BGR, dst=out.reshape(-1, width, 3))
+        for frame in out:
+            writer.write(frame)
+    return n
+
+
+def uniform_frame_indices(timestamps: np.ndarray, fps: float) -> np.ndarray:
+    """
+    Retime captured frames onto a constant-rate output grid.
+
+    Containers written here are constant frame rate, so jittery or faster-than-
+    output capture is mapped by picking, for each output tick, the captured
+    frame nearest in time (frames repeat across gaps and drop when capture
+    outpaces fps).
+
+    Args:
+        timestamps: Ascending capture timestamps in seconds (at least one)
+        fps: Output frame rate
+
+    Returns:
+        np.ndarray of frame indices, one per output frame
+    """
+    n_out = int(round(float(timestamps[-1] - timestamps[0]) * fps)) + 1
+    ticks = timestamps[0] + np.arange(n_out) / fps
+    if len(timestamps) < 2:
+        return np.zeros(n_out, dtype=np.intp)
+    after = np.clip(np.searchsorted(timestamps, ticks), 1, len(timestamps) - 1)
+    before_is_nearer = ticks - timestamps[after - 1] <= timestamps[after] - ticks
+    return after - before_is_nearer
@@ -6,6 +6,8 @@ Implements the same interface as CameraDevice for MindVision cameras.
 import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Iterator, Optional
 
 import cv2
@@ -15,6 +17,10 @@ from src.camera.device import CameraAccessDeniedError, CameraCapability, CameraE
 
 logger = logging.getLogger(__name__)
 
+# Capture indices probed by enumerate_cameras()
+PROBE_INDICES = 5
+PROBE_TIMEOUT_SEC = 3.0
+
 
 class WebcamDevice:
     """
@@ -24,6 +30,9 @@ class WebcamDevice:
     # Class-level lock for single-access enforcement
     _access_lock = threading.Lock()
     _active_devices = set()  # Track device indices currently in use
+    # Probes still opening an index after enumerate_cameras() gave up waiting;
+    # __enter__ waits for them so it never races a probe's capture handle
+    _pending_probes: dict[int, Future] = {}
 
     def __init__(self, camera_info: CameraInfo) -> None:
         """
@@ -32,7 +41,7 @@ class WebcamDevice:
         self._camera_info = camera_info
         self._cap: Optional[cv2.VideoCapture] = None
         self._initialized = False
-        self._frame_lock = threading.RLock()
+        self._frame_lock = threading.Lock()  # Serializes VideoCapture.read() in get_frame()
         self._width = 0
         self._height = 0
         self._fps = 0.0
@@ -41,12 +50,36 @@ class WebcamDevice:
     def enumerate_cameras() -> list[CameraInfo]:
         """
         Enumerate available webcams by probing indices.
+
+        Indices are probed concurrently (opening a capture can take up to a second
+        per index on some backends). A probe still pending after
+        PROBE_TIMEOUT_SEC is treated as no camera; an open call can't be
+        interrupted, so its thread finishes in the background, releases the
+        capture, and until then blocks __enter__ on that index.
         """
+        with WebcamDevice._access_lock:
+            pending = set(WebcamDevice._pending_probes)
+        pool = ThreadPoolExecutor(max_workers=PROBE_INDICES, thread_name_prefix="webcam-probe")
+        futures = {
+            i: pool.submit(WebcamDevice._probe, i) for i in range(PROBE_INDICES) if i not in pending
+        }
+        pool.shutdown(wait=False)
+
         cameras = []
-        # Probe first 5 indices
-        for i in range(5):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
+        deadline = time.monotonic() + PROBE_TIMEOUT_SEC
+        for i, future in futures.items():
+            try:
+                opened = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                logger.warning(f"Webcam probe for index {i} timed out")
+                with WebcamDevice._access_lock:
+                    WebcamDevice._pending_probes[i] = future
+                future.add_done_callback(lambda done, i=i: WebcamDevice._probe_finished(i, done))
+                continue
+            except Exception as e:
+                logger.debug(f"Webcam probe for index {i} failed: {e}")
+                continue
+            if opened:
                 # On some platforms, we can't get a friendly name easily from OpenCV
                 # We'll just use "Webcam {i}"
                 cameras.append(
@@ -57,9 +90,24 @@ class WebcamDevice:
                         source_type="webcam",
                     )
                 )
-                cap.release()
         return cameras
 
+    @staticmethod
+    def _probe(index: int) -> bool:
+        """Open and release capture index, returning whether it opened."""
+        cap = cv2.VideoCapture(index)
+        try:
+            return cap.isOpened()
+        finally:
+            cap.release()
+
+    @staticmethod
+    def _probe_finished(index: int, future: Future) -> None:
+        """Forget a timed-out probe once it has released its capture."""
+        with WebcamDevice._access_lock:
+            if WebcamDevice._pending_probes.get(index) is future:
+                del WebcamDevice._pending_probes[index]
+
     def get_capability(self) -> CameraCapability:
         """
         Get camera hardware capabilities.
@@ -74,6 +122,16 @@ class WebcamDevice:
             max_fps=self._fps if self._fps > 0 else 30.0,
         )
 
+    @property
+    def camera_info(self) -> CameraInfo:
+        """Camera this device was created for."""
+        return self._camera_info
+
+    @property
+    def is_initialized(self) -> bool:
+        """True while the webcam is open."""
+        return self._initialized
+
     def info(self) -> str:
         """
         Get camera info string.
@@ -98,12 +156,33 @@ class WebcamDevice:
             self._active_devices.add(device_key)
 
         try:
+            # A timed-out enumerate_cameras() probe may still hold this index
+            with self._access_lock:
+                probe = self._pending_probes.get(self._camera_info.device_index)
+            if probe is not None:
+                try:
+                    probe.result(timeout=PROBE_TIMEOUT_SEC)
+                except FuturesTimeoutError:
+                    raise CameraError(
+                        f"Webcam {self._camera_info.device_index} is still being probed",
+                        error_code=-1,
+                    )
+                except Exception:
+                    pass  # Probe failed; it released its capture either way
+                self._probe_finished(self._camera_info.device_index, probe)
+
             self._cap = cv2.VideoCapture(self._camera_info.device_index)
             if not self._cap.isOpened():
                 raise CameraError(
                     f"Failed to open webcam {self._camera_info.device_index}", error_code=-1
                 )
 
+            # Keep only the newest frame queued in the driver: when the consumer
+            # falls behind, read() returns a fresh frame instead of stale ones that
+            # would each still be decoded and color-converted. Best effort, not
+            # every backend honors it.
+            self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
             # Get actual resolution
             self._width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             self._height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
@@ -122,6 +201,10 @@ class WebcamDevice:
     def capture_frames(self) -> Iterator[np.ndarray]:
         """
         Continuously yield frames from webcam.
+
+        Frames are RGB like CameraDevice's: the BGR frame OpenCV returns is
+        freshly allocated per read, so it is swapped to RGB in place (one pass,
+        no second full-frame buffer).
         """
         if not self._initialized or self._cap is None:
             raise RuntimeError("Camera not initialized. Call __enter__() first.")
@@ -134,8 +217,7 @@ class WebcamDevice:
                 continue
 
             # OpenCV returns BGR, we need RGB for Gradio
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            yield frame_rgb
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """
@@ -150,19 +232,28 @@ class WebcamDevice:
             device_key = f"webcam_{self._camera_info.device_index}"
             self._active_devices.discard(device_key)
 
-    def get_frame(self) -> Optional[np.ndarray]:
+    def get_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         Get a single frame from the webcam (thread-safe).
+
+        Args:
+            out: Optional caller-owned (H, W, 3) uint8 buffer reused as the RGB
+                destination. Without one (or if it doesn't match) the frame read
+                from OpenCV is swapped to RGB in place.
         """
+        # Only the VideoCapture read needs serializing; the frame it returns is
+        # ours, so the color conversion runs outside the lock
         with self._frame_lock:
             if not self._initialized or self._cap is None:
                 return None
-
             ret, frame = self._cap.read()
-            if not ret:
-                return None
 
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if not ret:
+            return None
+
+        if out is not None and out.shape == frame.shape and out.dtype == frame.dtype:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
 
     def set_exposure_time(self, exposure_us: float) -> None:
         """
@@ -565,22 +565,30 @@ def create_camera_app() -> gr.Blocks:
 
                 # Require buffer >= requested duration (not just min(1.0, requested_duration))
                 if buffer_stats["duration_sec"] < requested_duration:
-                    return (
+                    yield (
                         gr.DownloadButton(visible=False),
                         f"⚠️ Buffer too short: {buffer_stats['duration_sec']:.1f}s < {requested_duration:.1f}s",
                     )
+                    return
 
-                clip_path = recorder.save_slowmo_clip(
+                # Frames are staged before this returns; the encode may still be
+                # running in the pool, so show progress while waiting on it
+                pending = recorder.save_slowmo_clip_async(
                     duration_sec=requested_duration, playback_fps=playback_fps
                 )
+                if not pending.done():
+                    yield gr.DownloadButton(visible=False), "⏳ Encoding clip..."
+                clip_path = pending.result()
                 if clip_path:
-                    return gr.DownloadButton(
-                        label="⬇️ Download Clip", value=clip_path, visible=True
-                    ), f"✅ Saved {buffer_stats['slowmo_factor']:.1f}x slow-mo"
-                return gr.DownloadButton(visible=False), "❌ Failed to save"
+                    yield (
+                        gr.DownloadButton(label="⬇️ Download Clip", value=clip_path, visible=True),
+                        f"✅ Saved {buffer_stats['slowmo_factor']:.1f}x slow-mo",
+                    )
+                    return
+                yield gr.DownloadButton(visible=False), "❌ Failed to save"
             except Exception as e:
                 logger.error(f"Record error: {e}")
-                return gr.DownloadButton(visible=False), f"❌ Error: {e}"
+                yield gr.DownloadButton(visible=False), f"❌ Error: {e}"
 
         def on_duration_change(d):
             clip_duration_sec["value"] = d
@@ -8,7 +8,7 @@ import logging
 from typing import Optional, Union
 
 from src.camera.device import CameraDevice, CameraInfo
-from src.camera.init import initialize_camera
+from src.camera.init import initialize_camera, release_camera
 from src.camera.webcam import WebcamDevice
 from src.ui.session import ViewerSession
 
@@ -79,10 +79,10 @@ class SessionLifecycle:
         return None
 
     def _cleanup_camera(self) -> None:
-        """Internal helper to cleanup camera resources."""
+        """Internal helper to cleanup camera resources (see release_camera for pooling)."""
         if self.camera:
             try:
-                self.camera.__exit__(None, None, None)
+                release_camera(self.camera)
             except Exception as e:
                 logger.error(f"Error during camera cleanup: {e}")
             finally:
@@ -4,9 +4,10 @@ Implements the ViewerSession contract from specs/001-using-gradio-as/contracts/v
 Maps to FR-006a, FR-005
 """
 
+import itertools
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
 # ------------------------------------------------------------------
@@ -14,12 +15,12 @@ from typing import Optional
 # ------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Viewer session metadata"""
 
     session_hash: str  # Gradio session UUID
-    start_time: datetime
+    start_time: float  # time.monotonic() at session start
     is_active: bool
 
 
@@ -34,32 +35,33 @@ class ViewerSession:
 
     Ensures only one active viewer session globally.
     Coordinates with camera device for exclusive access.
+
+    The single slot is a plain dict. Claiming it is one dict.setdefault()
+    call, which the GIL makes atomic, so starting a session never takes a
+    lock. Ending a session does check-then-remove, so that path keeps the lock.
     """
 
+    _SLOT = "active"
+
     def __init__(self) -> None:
         self._lock = threading.RLock()
-        self._active_session: Optional[SessionInfo] = None
+        self._slot: dict[str, SessionInfo] = {}
 
     def try_start_session(self, session_hash: str) -> bool:
         """
         Attempt to start a new viewer session.
 
-        Thread-safe implementation of contract.
+        Thread-safe implementation of contract (atomic compare-and-set on the slot).
         """
-        with self._lock:
-            # Check if session already active
-            if self._active_session is not None:
-                # Allow retry of same session
-                if self._active_session.session_hash == session_hash:
-                    return True
-                # Different session active
-                return False
-
-            # Start new session
-            self._active_session = SessionInfo(
-                session_hash=session_hash, start_time=datetime.now(), is_active=True
+        # Fast path: slot already held (by this session on retry, or by another)
+        current = self._slot.get(self._SLOT)
+        if current is None:
+            candidate = SessionInfo(
+                session_hash=session_hash, start_time=time.monotonic(), is_active=True
             )
-            return True
+            current = self._slot.setdefault(self._SLOT, candidate)
+        # Allow retry of same session; a different session means the slot is taken
+        return current.session_hash == session_hash
 
     def end_session(self, session_hash: str) -> None:
         """
@@ -68,12 +70,10 @@ class ViewerSession:
         Thread-safe implementation of contract.
         """
         with self._lock:
-            if (
-                self._active_session is not None
-                and self._active_session.session_hash == session_hash
-            ):
-                self._active_session.is_active = False
-                self._active_session = None
+            current = self._slot.get(self._SLOT)
+            if current is not None and current.session_hash == session_hash:
+                current.is_active = False
+                del self._slot[self._SLOT]
 
     def get_active_session(self) -> Optional[SessionInfo]:
         """
@@ -81,27 +81,23 @@ class ViewerSession:
 
         Returns snapshot copy for thread safety.
         """
-        with self._lock:
-            if self._active_session is None:
-                return None
-
-            # Return snapshot copy
-            return SessionInfo(
-                session_hash=self._active_session.session_hash,
-                start_time=self._active_session.start_time,
-                is_active=self._active_session.is_active,
-            )
+        current = self._slot.get(self._SLOT)
+        if current is None:
+            return None
+
+        # Return snapshot copy
+        return SessionInfo(
+            session_hash=current.session_hash,
+            start_time=current.start_time,
+            is_active=current.is_active,
+        )
 
     def is_session_active(self, session_hash: str) -> bool:
         """
         Check if specific session is active.
         """
-        with self._lock:
-            return (
-                self._active_session is not None
-                and self._active_session.session_hash == session_hash
-                and self._active_session.is_active
-            )
+        current = self._slot.get(self._SLOT)
+        return current is not None and current.session_hash == session_hash and current.is_active
 
 
 # ------------------------------------------------------------------
@@ -115,14 +111,18 @@ class StreamState:
 
     Coordinates with ViewerSession for resource control.
     Thread-safe counters and state tracking.
+
+    Frame and error counters are itertools.count() iterators: next() on them is
+    a single C call that the GIL makes atomic, so the per-frame increments take
+    no Python-level lock. Resetting rebinds a fresh counter.
     """
 
     def __init__(self, session_manager: ViewerSession) -> None:
         self._session_manager = session_manager
         self._lock = threading.RLock()
         self._is_streaming = False
-        self._frame_count = 0
-        self._error_count = 0
+        self._frame_counter = itertools.count(1)
+        self._error_counter = itertools.count(1)
 
     def start_streaming(self, session_id: str) -> None:
         """
@@ -140,7 +140,7 @@ class StreamState:
         """
         with self._lock:
             self._is_streaming = False
-            self._error_count = 0  # Reset error counter
+            self._error_counter = itertools.count(1)  # Reset error counter
 
     def is_streaming(self) -> bool:
         """
@@ -153,24 +153,19 @@ class StreamState:
         """
         Record successful frame capture.
         """
-        with self._lock:
-            self._frame_count += 1
-            return self._frame_count
+        return next(self._frame_counter)
 
     def increment_error_count(self) -> int:
         """
         Record frame capture error.
         """
-        with self._lock:
-            self._error_count += 1
-            return self._error_count
+        return next(self._error_counter)
 
     def reset_error_count(self) -> None:
         """
         Clear error counter after successful frame.
         """
-        with self._lock:
-            self._error_count = 0
+        self._error_counter = itertools.count(1)
 
 
 # ------------------------------------------------------------------
@@ -41,7 +41,7 @@ def mock_mvsdk(mocker):
     mock_frame_head.iWidth = 640
     mock_frame_head.iHeight = 480
     mock_frame_head.uiMediaType = mock_sdk.CAMERA_MEDIA_TYPE_BGR8
-    mock_frame_head.uBytes = frame_data.nbytes
+    mock_frame_head.uBytes = 480 * 640  # Raw Bayer size until the ISP runs
 
     mock_sdk.CameraGetImageBuffer.return_value = (frame_data.ctypes.data, mock_frame_head)
     mock_sdk.CameraReleaseImageBuffer.return_value = 0
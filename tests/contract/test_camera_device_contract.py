@@ -89,6 +89,67 @@ class TestCameraDeviceContract:
                 with camera2:
                     pass
 
+    def test_cross_process_access_enforcement(self, mock_mvsdk):
+        """Contract: A device locked by another process raises CameraAccessDeniedError"""
+        from src.camera.device import (
+            CameraAccessDeniedError,
+            CameraDevice,
+            _device_lock_key,
+            _lock_device_file,
+            _unlock_device_file,
+        )
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        # A separate open file description stands in for the other process
+        other = _lock_device_file(_device_lock_key(cameras[0]))
+        try:
+            with pytest.raises(CameraAccessDeniedError):
+                with CameraDevice(cameras[0]):
+                    pass
+        finally:
+            _unlock_device_file(other)
+
+        # Lock released: the device opens again
+        with CameraDevice(cameras[0]):
+            pass
+
+    def test_device_lock_follows_serial_number(self, mock_mvsdk):
+        """Contract: The cross-process lock is keyed on the serial, not the index"""
+        from dataclasses import replace
+
+        from src.camera.device import (
+            CameraAccessDeniedError,
+            CameraDevice,
+            _device_lock_key,
+            _lock_device_file,
+            _unlock_device_file,
+        )
+
+        cameras = CameraDevice.enumerate_cameras()
+        assert cameras[0].serial_number == "SN0001"
+
+        # Same camera seen at another index (e.g. after a replug elsewhere)
+        other = _lock_device_file(_device_lock_key(replace(cameras[0], device_index=3)))
+        try:
+            with pytest.raises(CameraAccessDeniedError):
+                with CameraDevice(cameras[0]):
+                    pass
+        finally:
+            _unlock_device_file(other)
+
+    def test_unopenable_lock_file_denies_access(self, mock_mvsdk, mocker):
+        """Contract: A lock file that can't be opened raises CameraAccessDeniedError"""
+        from src.camera.device import CameraAccessDeniedError, CameraDevice
+
+        cameras = CameraDevice.enumerate_cameras()
+        mocker.patch("builtins.open", side_effect=PermissionError("Permission denied"))
+
+        with pytest.raises(CameraAccessDeniedError, match="lock file"):
+            with CameraDevice(cameras[0]):
+                pass
+        assert cameras[0].device_index not in CameraDevice._active_devices
+
     def test_capability_requires_init(self, mock_mvsdk):
         """Contract: get_capability() before __enter__() raises RuntimeError"""
         from src.camera.device import CameraDevice
@@ -169,6 +230,114 @@ class TestCameraDeviceContract:
                 assert frame.shape[0] == expected_height
                 assert frame.shape[1] == expected_width
 
+    def test_get_frame_into_out_buffer(self, mock_mvsdk):
+        """Contract: get_frame(out=...) processes into the caller's buffer"""
+        from src.camera.device import CameraDevice
+
+        cameras = CameraDevice.enumerate_cameras()
+        out = np.empty((480, 640, 3), dtype=np.uint8)
+
+        with CameraDevice(cameras[0]) as camera:
+            frame = camera.get_frame(out=out)
+
+            assert frame.shape == (480, 640, 3)
+            assert np.shares_memory(frame, out)
+            dst = mock_mvsdk.CameraImageProcess.call_args[0][2]
+            assert dst == out.ctypes.data
+
+            with pytest.raises(ValueError, match="too small"):
+                camera.get_frame(out=np.empty(16, dtype=np.uint8))
+
+            # Raw Bayer-sized buffer must be rejected before the ISP writes RGB into it
+            processed = mock_mvsdk.CameraImageProcess.call_count
+            with pytest.raises(ValueError, match="too small"):
+                camera.get_frame(out=np.empty((480, 640), dtype=np.uint8))
+            assert mock_mvsdk.CameraImageProcess.call_count == processed
+
+    def test_frame_shape_follows_frame_head(self, mock_mvsdk):
+        """Contract: Frame shape tracks the frame head when the ROI changes mid-stream"""
+        from src.camera.device import CameraDevice
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        with CameraDevice(cameras[0]) as camera:
+            frames = camera.capture_frames()
+            assert next(frames).shape == (480, 640, 3)
+
+            frame_head = mock_mvsdk.CameraGetImageBuffer.return_value[1]
+            frame_head.iHeight, frame_head.iWidth = 240, 320
+            frame_head.uBytes = 240 * 320  # Raw Bayer size until the ISP runs
+            assert next(frames).shape == (240, 320, 3)
+
+    def test_windows_flip_uses_isp_mirror(self, mock_mvsdk, mocker):
+        """Contract: Windows vertical flip is done by the ISP, not per frame"""
+        from src.camera.device import CameraDevice
+
+        mocker.patch("src.camera.device._IS_WINDOWS", True)
+        mock_mvsdk.CAMERA_STATUS_SUCCESS = 0
+        mock_mvsdk.CameraSetMirror.return_value = 0
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        with CameraDevice(cameras[0]) as camera:
+            next(camera.capture_frames())
+
+            mock_mvsdk.CameraSetMirror.assert_called_once_with(12345, 1, 1)
+            mock_mvsdk.CameraFlipFrameBuffer.assert_not_called()
+
+    def test_color_rgb8_output_needs_no_swap(self, mock_mvsdk):
+        """Contract: ISP RGB8 output yields contiguous frames without a BGR swap view"""
+        from src.camera.device import CameraDevice
+
+        mock_mvsdk.CAMERA_STATUS_SUCCESS = 0
+        mock_mvsdk.CAMERA_MEDIA_TYPE_RGB8 = 0x02000014
+        mock_mvsdk.CameraSetIspOutFormat.return_value = 0
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        with CameraDevice(cameras[0]) as camera:
+            frame = next(camera.capture_frames())
+
+            mock_mvsdk.CameraSetIspOutFormat.assert_called_once_with(12345, 0x02000014)
+            assert frame.shape == (480, 640, 3)
+            assert frame.flags.c_contiguous
+
+    def test_pause_and_resume_streaming(self, mock_mvsdk):
+        """Contract: pause/resume keep the device open and succeed on status 0"""
+        from src.camera.device import CameraDevice
+
+        mock_mvsdk.CAMERA_STATUS_SUCCESS = 0
+        mock_mvsdk.CameraPause.return_value = 0
+        mock_mvsdk.CameraPlay.return_value = 0
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        with CameraDevice(cameras[0]) as camera:
+            camera.pause_streaming()
+            camera.resume_streaming()
+
+            mock_mvsdk.CameraPause.assert_called_once_with(12345)
+            mock_mvsdk.CameraUnInit.assert_not_called()
+
+    def test_pause_and_resume_raise_on_error_status(self, mock_mvsdk):
+        """Contract: a non-zero SDK status from pause/resume raises CameraError"""
+        from src.camera.device import CameraDevice, CameraError
+
+        mock_mvsdk.CAMERA_STATUS_SUCCESS = 0
+        mock_mvsdk.CameraGetErrorString.return_value = "device lost"
+
+        cameras = CameraDevice.enumerate_cameras()
+
+        with CameraDevice(cameras[0]) as camera:
+            mock_mvsdk.CameraPause.return_value = -37
+            with pytest.raises(CameraError) as exc_info:
+                camera.pause_streaming()
+            assert exc_info.value.error_code == -37
+
+            mock_mvsdk.CameraPlay.return_value = -37
+            with pytest.raises(CameraError, match="device lost"):
+                camera.resume_streaming()
+
 
 # Pytest Fixtures (defined in conftest.py or here)
 
@@ -182,6 +351,7 @@ def mock_mvsdk(mocker):
     mock_camera_info = MagicMock()
     mock_camera_info.GetFriendlyName.return_value = "Test Camera"
     mock_camera_info.GetPortType.return_value = "USB"
+    mock_camera_info.GetSn.return_value = "SN0001"
 
     mock_sdk.CameraEnumerateDevice.return_value = [mock_camera_info]
 
@@ -206,15 +376,13 @@ def mock_mvsdk(mocker):
     mock_frame_head.iHeight = 480
     mock_frame_head.iWidth = 640
     mock_frame_head.uiMediaType = 0x02000002  # BGR8
-    mock_frame_head.uBytes = 480 * 640 * 3
+    mock_frame_head.uBytes = 480 * 640  # Raw Bayer size until the ISP runs
     mock_sdk.CameraGetImageBuffer.return_value = (2000, mock_frame_head)  # pRawData, FrameHead
     mock_sdk.CameraImageProcess.return_value = None
     mock_sdk.CameraReleaseImageBuffer.return_value = None
 
     # Mock ctypes for buffer access
-    mock_array_class = type(
-        "MockArray", (), {"from_address": lambda addr: bytes(mock_frame_head.uBytes)}
-    )
+    mock_array_class = type("MockArray", (), {"from_address": lambda addr: bytes(480 * 640 * 3)})
     mock_c_ubyte = MagicMock()
     mock_c_ubyte.__mul__ = lambda self, count: mock_array_class
     mock_sdk.c_ubyte = mock_c_ubyte
@@ -246,6 +414,7 @@ def mock_mvsdk_mono(mocker):
     mock_camera_info = MagicMock()
     mock_camera_info.GetFriendlyName.return_value = "Test Mono Camera"
     mock_camera_info.GetPortType.return_value = "USB"
+    mock_camera_info.GetSn.return_value = "SN0001"
 
     mocker.patch.object(mvsdk, "CameraEnumerateDevice", return_value=[mock_camera_info])
 
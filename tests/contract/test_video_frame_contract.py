@@ -3,7 +3,10 @@ Contract tests for VideoFrame data structure.
 Reference: specs/001-using-gradio-as/contracts/video_frame.py
 """
 
+import subprocess
+import sys
 import time
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -273,3 +276,140 @@ class TestVideoFrameContract:
 
         # Should be same underlying data (view, not copy)
         assert gradio_format is frame.data or np.shares_memory(gradio_format, frame.data)
+
+    def test_to_rgb_into_out_buffer(self):
+        """Contract: to_rgb() swaps BGR->RGB into a reused buffer"""
+        from src.camera.video_frame import to_rgb
+
+        bgr = np.zeros((480, 640, 3), dtype=np.uint8)
+        bgr[..., 0] = 255  # Blue channel
+        out = np.empty_like(bgr)
+
+        rgb = to_rgb(bgr, out)
+
+        assert rgb is out
+        assert (rgb[..., 2] == 255).all()
+        assert rgb.flags.c_contiguous
+
+    def test_to_rgb_mono(self):
+        """Contract: to_rgb() expands mono (H, W) to (H, W, 3)"""
+        from src.camera.video_frame import to_rgb
+
+        gray = np.full((480, 640), 7, dtype=np.uint8)
+
+        rgb = to_rgb(gray)
+
+        assert rgb.shape == (480, 640, 3)
+        assert (rgb == 7).all()
+
+    def test_from_trusted_skips_validation(self):
+        """Contract: from_trusted() builds an equal frame without re-validating"""
+        from src.camera.video_frame import VideoFrame
+
+        frame_data = np.zeros((480, 640, 3), dtype=np.uint8)
+        ts = time.time()
+        args = dict(
+            data=frame_data,
+            width=640,
+            height=480,
+            channels=3,
+            timestamp=ts,
+            sequence_number=5,
+            media_type=0x02000002,
+        )
+
+        trusted = VideoFrame.from_trusted(**args)
+
+        assert trusted.data is frame_data
+        assert (trusted.width, trusted.height, trusted.channels) == (640, 480, 3)
+        assert trusted.timestamp == ts
+        assert trusted.sequence_number == 5
+        with pytest.raises(AttributeError):
+            trusted.width = 800  # type: ignore
+
+    def test_to_gradio_format_read_only_view(self):
+        """Contract: to_gradio_format() returns a read-only view of the frame data"""
+        from src.camera.video_frame import VideoFrame
+
+        frame_data = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame = VideoFrame(
+            data=frame_data,
+            width=640,
+            height=480,
+            channels=3,
+            timestamp=time.time(),
+            sequence_number=0,
+            media_type=0x02000002,
+        )
+
+        view = frame.to_gradio_format()
+
+        assert not view.flags.writeable
+        assert np.shares_memory(view, frame_data)
+        assert frame_data.flags.writeable
+
+    def test_to_gradio_into_color(self):
+        """Contract: to_gradio_into() writes contiguous RGB into the caller's buffer"""
+        from src.camera.video_frame import VideoFrame
+
+        frame_data = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame_data[..., 0] = 255  # Blue channel
+        frame = VideoFrame(
+            data=frame_data,
+            width=640,
+            height=480,
+            channels=3,
+            timestamp=time.time(),
+            sequence_number=0,
+            media_type=0x02000002,
+        )
+        out = np.empty_like(frame_data)
+
+        rgb = frame.to_gradio_into(out)
+
+        assert rgb is out
+        assert rgb.flags.c_contiguous
+        assert np.array_equal(rgb, frame_data[..., ::-1])
+
+    def test_to_gradio_into_mono(self):
+        """Contract: to_gradio_into() returns mono frames as a view, ignoring out"""
+        from src.camera.video_frame import VideoFrame
+
+        frame_data = np.zeros((480, 640), dtype=np.uint8)
+        frame = VideoFrame(
+            data=frame_data,
+            width=640,
+            height=480,
+            channels=1,
+            timestamp=time.time(),
+            sequence_number=0,
+            media_type=0x01000001,
+        )
+
+        gray = frame.to_gradio_into(None)
+
+        assert gray.shape == (480, 640)
+        assert np.shares_memory(gray, frame_data)
+
+    def test_optimized_mode_skips_full_validation(self):
+        """Contract: under python -O only the channel count is validated"""
+        script = (
+            "import time, numpy as np\n"
+            "from src.camera.video_frame import VideoFrame\n"
+            "data = np.zeros((10, 10, 3), dtype=np.uint8)\n"
+            "VideoFrame(data, 640, 480, 3, time.time(), 0, 0)\n"
+            "try:\n"
+            "    VideoFrame(data, 10, 10, 2, time.time(), 0, 0)\n"
+            "except ValueError:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise SystemExit('channel count not checked')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-O", "-c", script],
+            cwd=Path(__file__).resolve().parents[2],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -4,7 +4,7 @@ These tests define the expected behavior - implementation in src/ui/session.py m
 Reference: specs/001-using-gradio-as/contracts/viewer_session.py
 """
 
-from datetime import datetime
+import time
 from threading import Thread
 
 import pytest
@@ -105,9 +105,9 @@ class TestViewerSessionContract:
         session_mgr = get_viewer_session()
 
         # Start session
-        before_time = datetime.now()
+        before_time = time.monotonic()
         assert session_mgr.try_start_session("session-1")
-        after_time = datetime.now()
+        after_time = time.monotonic()
 
         # Get active session info
         active = session_mgr.get_active_session()
@@ -33,6 +33,7 @@ def test_camera_feed_displays(mock_mvsdk):
         mock_dev_info = MagicMock()
         mock_dev_info.GetFriendlyName.return_value = "Test Camera"
         mock_dev_info.GetPortType.return_value = "USB"
+        mock_dev_info.GetSn.return_value = "SN0001"
         mock_sdk.CameraEnumerateDevice.return_value = [mock_dev_info]
 
         # Setup mock capability
@@ -52,7 +53,7 @@ def test_camera_feed_displays(mock_mvsdk):
         mock_frame_head.iWidth = 640
         mock_frame_head.iHeight = 480
         mock_frame_head.uiMediaType = mock_sdk.CAMERA_MEDIA_TYPE_BGR8
-        mock_frame_head.uBytes = 640 * 480 * 3
+        mock_frame_head.uBytes = 640 * 480  # Raw Bayer size until the ISP runs
 
         mock_sdk.CameraGetImageBuffer.return_value = (123, mock_frame_head)  # pRawData, FrameHead
         mock_sdk.CameraAlignMalloc.return_value = 456  # Frame buffer address
@@ -97,6 +98,7 @@ def test_camera_feed_color_and_mono_support():
         mock_dev_info = MagicMock()
         mock_dev_info.GetFriendlyName.return_value = "Color Camera"
         mock_dev_info.GetPortType.return_value = "USB"
+        mock_dev_info.GetSn.return_value = "SN0001"
         mock_sdk.CameraEnumerateDevice.return_value = [mock_dev_info]
 
         mock_cap = MagicMock()
@@ -121,6 +123,7 @@ def test_camera_feed_color_and_mono_support():
         mock_dev_info = MagicMock()
         mock_dev_info.GetFriendlyName.return_value = "Mono Camera"
         mock_dev_info.GetPortType.return_value = "USB"
+        mock_dev_info.GetSn.return_value = "SN0001"
         mock_sdk.CameraEnumerateDevice.return_value = [mock_dev_info]
 
         mock_cap = MagicMock()
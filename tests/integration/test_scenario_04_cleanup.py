@@ -20,6 +20,7 @@ def test_camera_cleanup_on_disconnect():
         mock_dev_info = MagicMock()
         mock_dev_info.GetFriendlyName.return_value = "Test Camera"
         mock_dev_info.GetPortType.return_value = "USB"
+        mock_dev_info.GetSn.return_value = "SN0001"
         mock_sdk.CameraEnumerateDevice.return_value = [mock_dev_info]
 
         mock_cap = MagicMock()
@@ -60,6 +61,7 @@ def test_camera_can_be_reinitialized_after_cleanup():
         mock_dev_info = MagicMock()
         mock_dev_info.GetFriendlyName.return_value = "Test Camera"
         mock_dev_info.GetPortType.return_value = "USB"
+        mock_dev_info.GetSn.return_value = "SN0001"
         mock_sdk.CameraEnumerateDevice.return_value = [mock_dev_info]
 
         mock_cap = MagicMock()
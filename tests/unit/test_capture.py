@@ -3,12 +3,14 @@ Unit tests for frame capture service.
 Tests T012 implementation.
 """
 
+import os
+import threading
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
-from src.camera.capture import create_frame_generator
+from src.camera.capture import CaptureSession, _pin_to_reserved_core, create_frame_generator
 from src.camera.device import CameraDevice, CameraError
 from src.lib import mvsdk
 
@@ -96,6 +98,49 @@ def test_frame_generator_sequence_numbering(mock_camera, caplog):
     assert any("sequence=3" in msg for msg in log_messages)
 
 
+def test_capture_session_pulls_frames_with_get_frame(mock_camera):
+    """CaptureSession feeds get_frame() results to the recorder, skipping timeouts"""
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    delivered = threading.Event()
+    recorder = MagicMock()
+    recorder.add_frame.side_effect = lambda f: delivered.set()
+    results = iter([None, frame])
+    mock_camera.get_frame.side_effect = lambda: next(results, None)
+
+    session = CaptureSession(mock_camera, recorder)
+    session.start()
+    try:
+        assert delivered.wait(timeout=2.0)
+    finally:
+        session.stop()
+
+    recorder.add_frame.assert_called_once_with(frame)
+    mock_camera.capture_frames.assert_not_called()
+
+
+def test_pin_to_reserved_core(mocker):
+    """Capture thread claims the core main.py --high-priority reserved"""
+    mocker.patch.dict("os.environ", {"CAPTURE_RESERVED_CORE": "3"})
+    setaffinity = mocker.patch("src.camera.capture.os.sched_setaffinity", create=True)
+
+    _pin_to_reserved_core()
+
+    setaffinity.assert_called_once_with(0, {3})
+
+
+def test_pin_without_reservation_is_noop(mocker):
+    """Cores missing from the affinity mask (taskset, cpuset) are not claimed"""
+    mocker.patch.dict("os.environ")
+    os.environ.pop("CAPTURE_RESERVED_CORE", None)
+    mocker.patch("src.camera.capture.os.cpu_count", return_value=4)
+    mocker.patch("src.camera.capture.os.sched_getaffinity", return_value={0, 1}, create=True)
+    setaffinity = mocker.patch("src.camera.capture.os.sched_setaffinity", create=True)
+
+    _pin_to_reserved_core()
+
+    setaffinity.assert_not_called()
+
+
 @pytest.fixture
 def mock_camera():
     """Mock CameraDevice for testing"""
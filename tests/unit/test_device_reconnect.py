@@ -3,6 +3,7 @@ Unit tests for CameraDevice reconnection logic.
 Tests the _attempt_reconnect() method and timeout-triggered reconnection.
 """
 
+import threading
 import time
 from unittest.mock import MagicMock
 
@@ -20,6 +21,7 @@ def mock_mvsdk_for_reconnect(mocker):
     mock_camera_info = MagicMock()
     mock_camera_info.GetFriendlyName.return_value = "Test Camera"
     mock_camera_info.GetPortType.return_value = "USB"
+    mock_camera_info.GetSn.return_value = "SN0001"
     mock_sdk.CameraEnumerateDevice.return_value = [mock_camera_info]
 
     # Mock capability
@@ -156,6 +158,9 @@ class TestTimeoutTriggeredReconnect:
             for _ in range(4):
                 camera.get_frame()
 
+            # Reconnect runs on a background thread
+            camera._reconnect_thread.join(timeout=2.0)
+
             # Reconnect should have been attempted
             assert reconnect_spy.call_count >= 1
 
@@ -198,9 +203,11 @@ class TestReconnectInGetFrameLocked:
 
             reconnect_spy = mocker.spy(camera, "_attempt_reconnect")
 
-            camera.get_frame()
+            assert camera.get_frame() is None  # Does not block on the reconnect
+            camera._reconnect_thread.join(timeout=5.0)
 
             reconnect_spy.assert_called_once()
+            assert camera._initialized is True
 
     def test_reconnect_respects_interval(self, mock_mvsdk_for_reconnect, mocker):
         """get_frame respects minimum reconnect interval."""
@@ -278,3 +285,67 @@ class TestCaptureFramesReconnect:
 
             # Reconnect should have been attempted
             assert reconnect_spy.call_count >= 1
+
+
+class TestExitDuringReconnect:
+    """Tests for __exit__ racing a background reconnect."""
+
+    def test_get_frame_not_blocked_by_camera_init(self, mock_mvsdk_for_reconnect):
+        """get_frame() returns None at once while the reconnect is inside CameraInit."""
+        cameras = CameraDevice.enumerate_cameras()
+        camera = CameraDevice(cameras[0])
+        camera._reconnect_backoff_seconds = 0.01
+        in_init = threading.Event()
+        finish_init = threading.Event()
+
+        def slow_init(*args):
+            in_init.set()
+            finish_init.wait(5.0)
+            return 67890
+
+        with camera:
+            mock_mvsdk_for_reconnect.CameraInit.side_effect = slow_init
+            camera._start_background_reconnect()
+            assert in_init.wait(5.0)
+
+            # The frame lock is free, so a frame consumer is never stalled
+            assert camera._frame_lock.acquire(blocking=False)
+            camera._frame_lock.release()
+            assert camera.get_frame() is None
+
+            finish_init.set()
+            camera._reconnect_thread.join(timeout=5.0)
+            assert camera._initialized is True
+
+    def test_exit_during_camera_init_releases_camera(self, mock_mvsdk_for_reconnect):
+        """__exit__ waits out a reconnect in CameraInit and releases the camera before returning."""
+        cameras = CameraDevice.enumerate_cameras()
+        camera = CameraDevice(cameras[0])
+        camera._reconnect_backoff_seconds = 0.01
+        in_init = threading.Event()
+        finish_init = threading.Event()
+
+        def slow_init(*args):
+            in_init.set()
+            finish_init.wait(5.0)
+            return 67890
+
+        camera.__enter__()
+        mock_mvsdk_for_reconnect.CameraInit.side_effect = slow_init
+        camera._start_background_reconnect()
+        assert in_init.wait(5.0)
+
+        exiter = threading.Thread(target=camera.__exit__, args=(None, None, None))
+        exiter.start()
+        exiter.join(timeout=0.1)
+        # Still waiting for CameraInit to return
+        assert exiter.is_alive()
+
+        finish_init.set()
+        exiter.join(timeout=5.0)
+        assert not exiter.is_alive()
+
+        mock_mvsdk_for_reconnect.CameraUnInit.assert_called_with(67890)
+        assert camera._handle is None
+        assert camera._initialized is False
+        assert camera._camera_info.device_index not in CameraDevice._active_devices
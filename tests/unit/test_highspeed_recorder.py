@@ -0,0 +1,303 @@
+"""
+Unit tests for HighSpeedRecorder.
+Tests the preallocated frame ring and slow-motion clip saving.
+"""
+
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from src.camera.highspeed_recorder import HighSpeedRecorder
+
+
+class TestHighSpeedRecorderBuffer:
+    """Tests for the preallocated frame ring."""
+
+    def test_add_frame_copies_into_ring(self):
+        """Frames are copied into the ring, not referenced."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir)
+
+            frame = np.zeros((48, 64, 3), dtype=np.uint8)
+            recorder.add_frame(frame)
+            frame[0, 0, 0] = 255
+
+            assert recorder.get_buffer_stats()["frame_count"] == 1
+            assert recorder.get_latest_frame()[0, 0, 0] == 0
+
+    def test_latest_frame_is_read_only_view(self):
+        """The preview frame is the newest ring slot, not a copy."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir)
+            recorder.add_frame(np.zeros((4, 4), dtype=np.uint8))
+            recorder.add_frame(np.ones((4, 4), dtype=np.uint8))
+
+            latest = recorder.get_latest_frame()
+            assert (latest == 1).all()
+            assert not latest.flags.writeable
+            assert np.shares_memory(latest, recorder._ring.frames)
+
+    def test_ring_keeps_newest_frames(self):
+        """When full, the oldest slot is overwritten in place."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=5, buffer_duration_sec=1.0, output_dir=tmpdir)
+            capacity = recorder._max_frames
+
+            for i in range(capacity + 3):
+                recorder.add_frame(np.full((4, 4), i, dtype=np.uint8))
+
+            _, frames = recorder._snapshot_ring()
+            assert len(frames) == capacity
+            assert [int(f[0, 0]) for f in frames] == list(range(3, capacity + 3))
+
+    def test_set_target_fps_keeps_newest_frames(self):
+        """Shrinking the ring keeps the most recent frames in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir)
+            for i in range(8):
+                recorder.add_frame(np.full((4, 4), i, dtype=np.uint8))
+
+            recorder.set_target_fps(5)  # 6 slots
+
+            _, frames = recorder._snapshot_ring()
+            assert [int(f[0, 0]) for f in frames] == [2, 3, 4, 5, 6, 7]
+
+    def test_snapshot_duration_filter(self):
+        """Only frames within duration_sec of the newest are copied out."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir)
+            clock = iter([i * 0.1 for i in range(8)])
+            with patch("src.camera.highspeed_recorder.time.time", side_effect=lambda: next(clock)):
+                for i in range(8):
+                    recorder.add_frame(np.full((4, 4), i, dtype=np.uint8))
+
+            timestamps, frames = recorder._snapshot_ring(duration_sec=0.25)
+
+            assert [int(f[0, 0]) for f in frames] == [5, 6, 7]
+            assert len(timestamps) == 3
+
+    def test_resolution_change_restarts_ring(self):
+        """A frame with a new shape reallocates the ring."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir)
+            recorder.add_frame(np.zeros((4, 4), dtype=np.uint8))
+            recorder.add_frame(np.zeros((8, 8), dtype=np.uint8))
+
+            assert recorder.get_buffer_stats()["frame_count"] == 1
+            assert recorder.get_latest_frame().shape == (8, 8)
+
+    def test_snapshot_never_returns_torn_frames(self):
+        """Snapshots taken while the capture thread writes are consistent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=5, buffer_duration_sec=1.0, output_dir=tmpdir)
+            stop = threading.Event()
+
+            def produce():
+                i = 0
+                while not stop.is_set():
+                    recorder.add_frame(np.full((64, 64), i % 256, dtype=np.uint8))
+                    i += 1
+
+            producer = threading.Thread(target=produce)
+            producer.start()
+            try:
+                for _ in range(200):
+                    for frame in recorder._snapshot_ring()[1]:
+                        assert (frame == frame[0, 0]).all()
+            finally:
+                stop.set()
+                producer.join()
+
+    def test_actual_fps_uses_last_window(self):
+        """Measured FPS comes from the newest window of frame timestamps."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=100, buffer_duration_sec=1.0, output_dir=tmpdir)
+            clock = iter([i * 0.1 for i in range(10)] + [1.0 + i * 0.01 for i in range(100)])
+            with patch("src.camera.highspeed_recorder.time.time", side_effect=lambda: next(clock)):
+                for _ in range(109):
+                    recorder.add_frame(np.zeros((4, 4), dtype=np.uint8))
+                assert abs(recorder.get_actual_fps() - 100.0) < 1e-6
+
+
+class TestHighSpeedRecorderDecimation:
+    """Tests for max_slowmo_factor capture decimation."""
+
+    def test_stores_every_kth_frame_above_max_slowmo(self):
+        """300 FPS capture with 30 FPS playback and 4x max keeps every 2nd frame."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=240,
+                buffer_duration_sec=3.0,
+                output_dir=tmpdir,
+                playback_fps=30,
+                max_slowmo_factor=4,
+            )
+            now = [0.0]
+            with patch("src.camera.highspeed_recorder.time.time", side_effect=lambda: now[0]):
+                for i in range(600):  # 2 s at 300 FPS
+                    now[0] = i / 300
+                    recorder.add_frame(np.zeros((4, 4), dtype=np.uint8))
+
+            # First second: FPS not yet measured, every frame kept; then k = 2
+            assert recorder._ring.written == 300 + 150
+            assert recorder._fps_written == 600
+
+
+class TestHighSpeedRecorderYuvStorage:
+    """Tests for frame_format="yuv420p" ring storage."""
+
+    def test_color_frames_stored_as_i420(self):
+        """Color frames take H·3/2 × W bytes in the ring; preview is RGB."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir, frame_format="yuv420p"
+            )
+            frame = np.empty((48, 64, 3), dtype=np.uint8)
+            frame[...] = (200, 100, 50)
+            recorder.add_frame(frame)
+
+            assert recorder._ring.frames.shape[1:] == (72, 64)
+            latest = recorder.get_latest_frame()
+            assert latest.shape == (48, 64, 3)
+            assert np.abs(latest.astype(int) - frame.astype(int)).max() <= 2
+
+    def test_mono_and_odd_frames_stored_as_is(self):
+        """Only even-sized color frames are converted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=10, buffer_duration_sec=1.0, output_dir=tmpdir, frame_format="yuv420p"
+            )
+            recorder.add_frame(np.zeros((48, 64), dtype=np.uint8))
+            assert not recorder._ring.yuv420p
+
+            recorder.add_frame(np.zeros((47, 64, 3), dtype=np.uint8))
+            assert not recorder._ring.yuv420p
+
+    def test_save_clip_from_i420_ring(self):
+        """I420 rings are encoded without an RGB round trip."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=30,
+                buffer_duration_sec=1.0,
+                output_dir=tmpdir,
+                encode_workers=0,
+                frame_format="yuv420p",
+            )
+            for i in range(10):
+                recorder.add_frame(np.full((48, 64, 3), i * 25, dtype=np.uint8))
+
+            result = recorder.save_slowmo_clip(filename="yuv.mp4")
+
+            assert result is not None
+            capture = cv2.VideoCapture(result)
+            try:
+                assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == 10
+                assert int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)) == 64
+                assert int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) == 48
+            finally:
+                capture.release()
+
+    def test_unknown_frame_format_rejected(self):
+        """frame_format is validated."""
+        with pytest.raises(ValueError):
+            HighSpeedRecorder(frame_format="nv12")
+
+
+class TestHighSpeedRecorderSaveClip:
+    """Tests for slow-motion clip saving."""
+
+    def test_save_slowmo_clip_creates_file(self):
+        """Saving writes an MP4 from the ring contents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=30, buffer_duration_sec=1.0, output_dir=tmpdir)
+            for i in range(10):
+                recorder.add_frame(np.full((48, 64, 3), i * 25, dtype=np.uint8))
+
+            result = recorder.save_slowmo_clip(filename="slowmo.mp4")
+
+            assert result is not None
+            assert os.path.exists(result)
+
+    def test_save_slowmo_clip_encodes_in_worker_process(self):
+        """Clips are encoded by the process pool unless encode_workers=0."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for workers in (1, 0):
+                recorder = HighSpeedRecorder(
+                    target_fps=30,
+                    buffer_duration_sec=1.0,
+                    output_dir=tmpdir,
+                    encode_workers=workers,
+                )
+                for i in range(10):
+                    recorder.add_frame(np.full((48, 64), i * 25, dtype=np.uint8))
+
+                result = recorder.save_slowmo_clip(filename=f"slowmo_{workers}.mp4")
+
+                assert result is not None
+                assert os.path.getsize(result) > 0
+                assert (recorder._encode_pool is not None) == bool(workers)
+                if recorder._encode_pool is not None:
+                    recorder._encode_pool.shutdown()
+
+    def test_save_slowmo_clip_async_returns_future(self):
+        """The async save resolves to the clip path once the worker finishes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=30, buffer_duration_sec=1.0, output_dir=tmpdir, encode_workers=1
+            )
+            for i in range(10):
+                recorder.add_frame(np.full((48, 64), i * 25, dtype=np.uint8))
+
+            future = recorder.save_slowmo_clip_async(filename="async.mp4")
+            result = future.result(timeout=60)
+
+            assert result == os.path.join(tmpdir, "async.mp4")
+            assert os.path.getsize(result) > 0
+            recorder._encode_pool.shutdown()
+
+    def test_save_slowmo_clip_skips_pool_when_shm_too_small(self):
+        """Clips larger than the free /dev/shm space are encoded in-process."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=30, buffer_duration_sec=1.0, output_dir=tmpdir, encode_workers=1
+            )
+            for i in range(10):
+                recorder.add_frame(np.full((48, 64), i * 25, dtype=np.uint8))
+
+            with patch("src.camera.highspeed_recorder._shm_free_bytes", return_value=1024):
+                result = recorder.save_slowmo_clip(filename="slowmo.mp4")
+
+            assert result is not None
+            assert recorder._encode_pool is None
+
+    def test_save_slowmo_clip_from_recording_buffer(self):
+        """Recorded frames are saved even after the ring has wrapped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(
+                target_fps=5, buffer_duration_sec=1.0, output_dir=tmpdir, encode_workers=0
+            )
+            recorder.start_recording()
+            for i in range(20):
+                recorder.add_frame(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+            assert recorder.stop_recording() == 20
+
+            with patch("src.camera.highspeed_recorder._encode_frames", return_value=True) as enc:
+                result = recorder.save_slowmo_clip(use_recording_buffer=True)
+
+            assert result is not None
+            frames = enc.call_args[0][0]
+            assert [int(f[0, 0, 0]) for f in frames] == [i * 10 for i in range(20)]
+
+    def test_save_slowmo_clip_insufficient_frames(self):
+        """Save returns None with fewer than two frames."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = HighSpeedRecorder(target_fps=30, buffer_duration_sec=1.0, output_dir=tmpdir)
+            assert recorder.save_slowmo_clip() is None
+
+            recorder.add_frame(np.zeros((48, 64, 3), dtype=np.uint8))
+            assert recorder.save_slowmo_clip() is None
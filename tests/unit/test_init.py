@@ -3,6 +3,7 @@ Unit tests for camera initialization logic.
 Tests T015 implementation.
 """
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -145,6 +146,142 @@ def test_initialize_camera_logs_info(mock_mvsdk, caplog):
             assert "Test Camera" in log_messages or "camera" in log_messages.lower()
 
 
+def _pooled_camera(info):
+    camera = MagicMock(spec=CameraDevice)
+    camera.is_initialized = True
+    camera.camera_info = info
+    return camera
+
+
+@pytest.fixture
+def camera_pool(monkeypatch):
+    """Enable the opt-in camera pool with a fake eviction timer"""
+    from src.camera import init
+
+    monkeypatch.setenv(init.POOL_IDLE_ENV, "30")
+    with patch("src.camera.init.threading.Timer") as mock_timer:
+        yield mock_timer
+        init.close_pooled_cameras()
+
+
+def test_release_camera_closes_when_pool_disabled(monkeypatch):
+    """Without CAMERA_POOL_IDLE_SEC a released camera is closed at once (FR-005)"""
+    from src.camera import init
+
+    monkeypatch.delenv(init.POOL_IDLE_ENV, raising=False)
+    camera = _pooled_camera(CameraInfo(0, "Test Camera", "USB", "mindvision"))
+
+    init.release_camera(camera)
+
+    camera.__exit__.assert_called_once_with(None, None, None)
+    camera.pause_streaming.assert_not_called()
+    assert init._POOL == {}
+
+
+def test_release_camera_reused_by_initialize(camera_pool):
+    """Released camera is handed back without reopening"""
+    from src.camera import init
+
+    info = CameraInfo(0, "Test Camera", "USB", "mindvision")
+    camera = _pooled_camera(info)
+
+    init.release_camera(camera)
+
+    with patch("src.camera.device.CameraDevice.__enter__") as mock_enter:
+        reused, error = initialize_camera(selected_info=info)
+
+    assert reused is camera
+    assert error is None
+    mock_enter.assert_not_called()
+    camera.__exit__.assert_not_called()
+    camera.pause_streaming.assert_called_once()
+    camera.resume_streaming.assert_called_once()
+
+
+def test_auto_detect_reuses_pooled_camera_without_enumerating(camera_pool):
+    """Auto-detection hands back a pooled camera before enumerating devices"""
+    from src.camera import init
+
+    info = CameraInfo(0, "Test Camera", "USB", "mindvision")
+    camera = _pooled_camera(info)
+
+    init.release_camera(camera)
+
+    with patch("src.camera.init.enumerate_all_cameras") as mock_enum:
+        reused, error = initialize_camera()
+
+    assert reused is camera
+    assert error is None
+    mock_enum.assert_not_called()
+
+
+def test_camera_closed_when_pause_fails(camera_pool):
+    """A camera that cannot stop streaming is closed rather than pooled"""
+    from src.camera import init
+
+    info = CameraInfo(0, "Test Camera", "USB", "mindvision")
+    camera = _pooled_camera(info)
+    camera.pause_streaming.side_effect = CameraError("pause failed", -1)
+
+    init.release_camera(camera)
+
+    camera.__exit__.assert_called_once_with(None, None, None)
+    assert init._POOL == {}
+
+
+def test_pooled_camera_reopened_when_resume_fails(camera_pool):
+    """A pooled camera that cannot restart streaming is closed, not handed back"""
+    from src.camera import init
+
+    info = CameraInfo(0, "Test Camera", "USB", "mindvision")
+    camera = _pooled_camera(info)
+    camera.resume_streaming.side_effect = CameraError("resume failed", -1)
+
+    init.release_camera(camera)
+
+    with patch("src.camera.device.CameraDevice.__enter__") as mock_enter:
+        mock_enter.side_effect = CameraError("no device", -1)
+        reused, error = initialize_camera(selected_info=info)
+
+    assert reused is None
+    assert error is not None
+    mock_enter.assert_called_once()
+    camera.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_pool_uses_one_rescheduled_eviction_timer(camera_pool):
+    """Each release re-arms the single eviction timer instead of adding one"""
+    from src.camera import init
+
+    first = _pooled_camera(CameraInfo(0, "Camera A", "USB", "mindvision"))
+    second = _pooled_camera(CameraInfo(1, "Camera B", "USB", "mindvision"))
+
+    init.release_camera(first)
+    timer = init._evict_timer
+    init.release_camera(second)
+
+    assert camera_pool.call_count == 2
+    timer.cancel.assert_called_once()
+    assert init._evict_timer is camera_pool.return_value
+
+
+def test_pooled_camera_closed_when_idle(camera_pool):
+    """Pooled camera is closed once the idle timeout has passed"""
+    from src.camera import init
+
+    info = CameraInfo(0, "Test Camera", "USB", "mindvision")
+    camera = _pooled_camera(info)
+
+    init.release_camera(camera)
+
+    with patch("src.camera.init.time.monotonic", return_value=time.monotonic() + 3600):
+        init._evict_idle()
+
+    camera.__exit__.assert_called_once_with(None, None, None)
+    assert init._POOL == {}
+    assert init._evict_timer is None
+
+
 @pytest.fixture
 def mock_mvsdk():
     """Mock MVSDK module"""
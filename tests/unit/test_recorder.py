@@ -7,10 +7,12 @@ import os
 import tempfile
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
+import pytest
 
-from src.camera.recorder import VideoRecorder
+from src.camera.recorder import CLEANUP_INTERVAL_SEC, VideoRecorder
 
 
 class TestVideoRecorderBuffer:
@@ -41,25 +43,41 @@ class TestVideoRecorderBuffer:
             _, buffered_frame = recorder._buffer[0]
             assert buffered_frame[0, 0, 0] == 0
 
-    def test_buffer_prunes_old_frames(self):
-        """Frames older than max_duration are pruned."""
+    def test_add_frame_without_copy_takes_ownership(self):
+        """copy=False stores the caller's array as-is."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            recorder = VideoRecorder(max_duration_sec=0.1, output_dir=tmpdir)
+            recorder = VideoRecorder(max_duration_sec=5.0, output_dir=tmpdir)
 
             frame = np.zeros((480, 640, 3), dtype=np.uint8)
+            recorder.add_frame(frame, copy=False)
 
-            # Add first frame
-            recorder.add_frame(frame)
-            assert recorder.get_buffer_frame_count() == 1
+            _, buffered_frame = recorder._buffer[0]
+            assert buffered_frame is frame
 
-            # Wait longer than max_duration
-            time.sleep(0.15)
+    def test_buffer_evicts_oldest_frames(self):
+        """Buffer is bounded by max_duration × target_fps frames."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = VideoRecorder(max_duration_sec=0.1, output_dir=tmpdir, target_fps=50)
+            capacity = recorder._buffer.maxlen
 
-            # Add second frame - should prune first
-            recorder.add_frame(frame)
+            for i in range(capacity + 3):
+                recorder.add_frame(np.full((4, 4), i, dtype=np.uint8))
 
-            # Should have 1-2 frames (timing dependent)
-            assert recorder.get_buffer_frame_count() >= 1
+            assert recorder.get_buffer_frame_count() == capacity
+            _, oldest = recorder._buffer[0]
+            assert oldest[0, 0] == 3
+
+    def test_buffer_holds_max_duration_at_any_rate(self):
+        """Without target_fps the buffer is bounded by time, not frame count."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = VideoRecorder(max_duration_sec=5.0, output_dir=tmpdir)
+            clock = iter([i / 200 for i in range(2000)])  # 10 s at 200 fps
+            with patch("src.camera.recorder.time.time", side_effect=lambda: next(clock)):
+                for i in range(2000):
+                    recorder.add_frame(np.zeros((4, 4), dtype=np.uint8), copy=False)
+
+            assert recorder.get_buffer_frame_count() == 1001
+            assert recorder.get_buffer_duration() == pytest.approx(5.0)
 
     def test_get_buffer_duration_empty(self):
         """Empty buffer returns 0 duration."""
@@ -174,6 +192,20 @@ class TestVideoRecorderSaveClip:
             assert result is not None
             assert os.path.exists(result)
 
+    def test_save_clip_selects_frames_in_duration(self):
+        """Only frames newer than now - duration_sec are written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = VideoRecorder(max_duration_sec=10.0, output_dir=tmpdir)
+            clock = iter([float(i) for i in range(10)] + [9.0])
+            with patch("src.camera.recorder.time.time", side_effect=lambda: next(clock)):
+                for i in range(10):
+                    recorder.add_frame(np.full((4, 4), i, dtype=np.uint8))
+                with patch.object(recorder, "_write_video_file", return_value=True) as write:
+                    recorder.save_clip(duration_sec=3.0)
+
+            frames_with_timestamps = write.call_args[0][0]
+            assert [ts for ts, _ in frames_with_timestamps] == [6.0, 7.0, 8.0, 9.0]
+
     def test_save_clip_mono_frames(self):
         """Save works with monochrome frames."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -243,6 +275,24 @@ class TestVideoRecorderCleanup:
             # Old clip should be deleted
             assert not old_clip.exists()
 
+    def test_cleanup_runs_at_most_once_per_interval(self):
+        """Back-to-back saves don't rescan the clip directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            recorder = VideoRecorder(max_duration_sec=5.0, output_dir=tmpdir, cleanup_age_hours=0)
+            recorder._cleanup_old_clips()
+
+            old_clip = Path(tmpdir) / "clip_20200101_000000.mp4"
+            old_clip.touch()
+            old_time = time.time() - 3600
+            os.utime(old_clip, (old_time, old_time))
+
+            recorder._cleanup_old_clips()
+            assert old_clip.exists()
+
+            recorder._last_cleanup -= CLEANUP_INTERVAL_SEC
+            recorder._cleanup_old_clips()
+            assert not old_clip.exists()
+
     def test_output_directory_created(self):
         """Output directory is created if it doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
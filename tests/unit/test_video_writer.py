@@ -0,0 +1,138 @@
+"""
+Unit tests for the shared clip video writer factory.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from src.camera import video_writer
+from src.camera.video_writer import (
+    PIX_FMT_BGR24,
+    PIX_FMT_YUV420P,
+    open_video_writer,
+    uniform_frame_indices,
+    write_frames,
+)
+
+
+def test_falls_back_to_opencv_without_nvenc(mocker):
+    """An ffmpegcv NVENC failure falls back to the OpenCV writer."""
+    fake_ffmpegcv = MagicMock()
+    fake_ffmpegcv.VideoWriterNV.side_effect = RuntimeError("no NVENC")
+    mocker.patch.object(video_writer, "ffmpegcv", fake_ffmpegcv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        writer, pix_fmt = open_video_writer(Path(tmpdir) / "clip.mp4", 30.0, (64, 48), True)
+        try:
+            assert writer.isOpened()
+            assert not isinstance(writer, MagicMock)
+            assert pix_fmt == PIX_FMT_BGR24
+        finally:
+            writer.release()
+
+
+def test_prefers_nvenc_when_available(mocker):
+    """The NVENC writer is used when ffmpegcv can open it."""
+    fake_ffmpegcv = MagicMock()
+    mocker.patch.object(video_writer, "ffmpegcv", fake_ffmpegcv)
+
+    writer, pix_fmt = open_video_writer(Path("clip.mp4"), 30.0, (64, 48), True)
+
+    assert writer is fake_ffmpegcv.VideoWriterNV.return_value
+    assert pix_fmt == PIX_FMT_YUV420P
+    fake_ffmpegcv.VideoWriterNV.assert_called_once_with("clip.mp4", "h264", 30.0, pix_fmt="yuv420p")
+
+
+def test_hardware_codec_selected_through_writer_options(mocker):
+    """A V4L2 M2M request sets OpenCV's FFmpeg writer options only while opening."""
+    mocker.patch.object(video_writer, "ffmpegcv", None)
+    mocker.patch.dict(os.environ, clear=False)
+    os.environ.pop("OPENCV_FFMPEG_WRITER_OPTIONS", None)
+    seen = []
+
+    def fake_writer(*args, **kwargs):
+        seen.append(os.environ.get("OPENCV_FFMPEG_WRITER_OPTIONS"))
+        return MagicMock()
+
+    mocker.patch.object(video_writer.cv2, "VideoWriter", side_effect=fake_writer)
+
+    writer, pix_fmt = open_video_writer(Path("clip.mp4"), 30.0, (64, 48), True, codec="v4l2m2m")
+
+    assert seen == ["video_codec;h264_v4l2m2m"]
+    assert pix_fmt == PIX_FMT_BGR24
+    assert "OPENCV_FFMPEG_WRITER_OPTIONS" not in os.environ
+
+
+def test_unknown_codec_rejected():
+    """Codec names are validated."""
+    with pytest.raises(ValueError):
+        open_video_writer(Path("clip.mp4"), 30.0, (64, 48), True, codec="h265")
+
+
+def test_opencv_mono_clip_contains_frames(mocker):
+    """Mono frames are written single-channel to the isColor=False writer."""
+    mocker.patch.object(video_writer, "ffmpegcv", None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "mono.mp4"
+        writer, pix_fmt = open_video_writer(path, 30.0, (64, 48), False)
+        frames = [np.full((48, 64), i * 20, dtype=np.uint8) for i in range(5)]
+        try:
+            assert write_frames(writer, pix_fmt, frames, False) == 5
+        finally:
+            writer.release()
+
+        capture = cv2.VideoCapture(str(path))
+        try:
+            assert int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) == 5
+        finally:
+            capture.release()
+
+
+def test_write_frames_yuv420p_layout():
+    """YUV420P writers receive I420 frames; mono frames get neutral chroma."""
+    writer = MagicMock()
+    rgb = np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8)
+
+    assert write_frames(writer, PIX_FMT_YUV420P, [rgb], True) == 1
+    written = writer.write.call_args[0][0]
+    assert np.array_equal(written, cv2.cvtColor(rgb, cv2.COLOR_RGB2YUV_I420))
+
+    mono = np.full((48, 64), 77, dtype=np.uint8)
+    write_frames(writer, PIX_FMT_YUV420P, [mono, mono], False)
+    written = writer.write.call_args[0][0]
+    assert written.shape == (72, 64)
+    assert (written[:48] == 77).all()
+    assert (written[48:] == 128).all()
+
+
+def test_write_frames_stacked_rgb_converted_in_tiles(mocker):
+    """Stacked RGB frames are converted several per cvtColor call."""
+    mocker.patch.object(video_writer, "_CONVERT_TILE_BYTES", 3 * 48 * 64 * 3)
+    frames = np.random.randint(0, 256, (7, 48, 64, 3), dtype=np.uint8)
+    written = []
+    writer = MagicMock()
+    writer.write.side_effect = lambda frame: written.append(frame.copy())
+
+    assert write_frames(writer, PIX_FMT_BGR24, frames, True) == 7
+    assert len(written) == 7
+    for frame, out in zip(frames, written):
+        assert np.array_equal(out, frame[..., ::-1])
+
+
+def test_uniform_frame_indices_retimes_capture():
+    """Output frames follow capture time, not capture order."""
+    # 120 FPS capture written at 60 FPS keeps every other frame
+    timestamps = np.arange(121) / 120.0
+    assert list(uniform_frame_indices(timestamps, 60.0)) == list(range(0, 121, 2))
+
+    # A dropped-frame gap repeats the nearest frame instead of speeding up playback
+    timestamps = np.array([0.0, 0.1, 0.4, 0.5])
+    indices = uniform_frame_indices(timestamps, 10.0)
+    assert len(indices) == 6
+    assert indices[0] == 0 and indices[1] == 1 and indices[-2:].tolist() == [2, 3]
@@ -78,3 +78,102 @@ class TestWebcamDevice(unittest.TestCase):
             frame = next(frames)
             self.assertEqual(frame.shape, (480, 640, 3))
             self.assertEqual(mock_cap.read.call_count, 2)
+
+    @patch("cv2.VideoCapture")
+    def test_get_frame_into_out_buffer(self, mock_vc):
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_vc.return_value = mock_cap
+
+        bgr = np.zeros((480, 640, 3), dtype=np.uint8)
+        bgr[..., 0] = 255  # Blue channel
+        mock_cap.read.return_value = (True, bgr)
+        out = np.empty_like(bgr)
+
+        with self.device as dev:
+            frame = dev.get_frame(out=out)
+
+        self.assertIs(frame, out)
+        self.assertTrue((frame[..., 2] == 255).all())
+
+    @patch("cv2.VideoCapture")
+    def test_capture_frames_swaps_in_place(self, mock_vc):
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_vc.return_value = mock_cap
+
+        bgr = np.zeros((480, 640, 3), dtype=np.uint8)
+        bgr[..., 0] = 255  # Blue channel
+        mock_cap.read.return_value = (True, bgr)
+
+        with self.device as dev:
+            frame = next(dev.capture_frames())
+
+        # Converted once, into the frame OpenCV handed back
+        self.assertIs(frame, bgr)
+        self.assertTrue((frame[..., 2] == 255).all())
+        self.assertTrue((frame[..., 0] == 0).all())
+
+    @patch("cv2.VideoCapture")
+    def test_get_frame_converts_outside_lock(self, mock_vc):
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_vc.return_value = mock_cap
+        mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+
+        with self.device as dev:
+            with patch("src.camera.webcam.cv2.cvtColor") as mock_cvt:
+                mock_cvt.side_effect = lambda *args, **kwargs: self.assertFalse(
+                    dev._frame_lock.locked()
+                )
+                dev.get_frame()
+
+        mock_cvt.assert_called_once()
+
+    @patch("cv2.VideoCapture")
+    def test_driver_queue_limited_to_latest_frame(self, mock_vc):
+        import cv2
+
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_vc.return_value = mock_cap
+
+        with self.device:
+            mock_cap.set.assert_any_call(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    @patch("src.camera.webcam.PROBE_TIMEOUT_SEC", 0.2)
+    @patch("cv2.VideoCapture")
+    def test_enumerate_cameras_skips_hung_probe(self, mock_vc):
+        import threading
+
+        release = threading.Event()
+
+        def side_effect(index):
+            if index == 1:
+                release.wait(5)  # Backend hangs opening this index
+            mock = MagicMock()
+            mock.isOpened.return_value = True
+            return mock
+
+        mock_vc.side_effect = side_effect
+
+        try:
+            cameras = WebcamDevice.enumerate_cameras()
+            self.assertEqual([c.device_index for c in cameras], [0, 2, 3, 4])
+            probe = WebcamDevice._pending_probes[1]
+            self.assertFalse(probe.done())
+        finally:
+            threading.Timer(0.1, release.set).start()
+
+        # Opening the hung index waits for its probe to release the capture
+        device = WebcamDevice(
+            CameraInfo(
+                device_index=1,
+                friendly_name="Webcam 1",
+                port_type="USB/Webcam",
+                source_type="webcam",
+            )
+        )
+        with device:
+            self.assertTrue(probe.done())
+        self.assertNotIn(1, WebcamDevice._pending_probes)